@@ -41,16 +41,71 @@ spec.loader.exec_module(requirements_rnac)
 requirements_rnac.check_and_print_dependencies()
 
 from helper_plot_hangul._font_resource import matplotlib_font_resource
+from helper_plot_hangul._font_watch import disable_font_watch, enable_font_watch, poll_font_dirs
+from helper_plot_hangul._glyph_cache import (
+    clear_glyph_cache,
+    disable_glyph_cache,
+    enable_glyph_cache,
+    glyph_cache_info,
+)
+from helper_plot_hangul._render_pool import clear_render_pool, render_pool_info
+from helper_plot_hangul._report import write_pdf_report
+from helper_plot_hangul._slim_font_manager import (
+    disable_slim_font_manager,
+    enable_slim_font_manager,
+    slim_font_family_map,
+)
+from helper_plot_hangul._text_collection import hangul_text_collection
+from helper_plot_hangul._text_measure import measure_text_width, truncate_texts, wrap_texts
+from helper_plot_hangul._textpath_cache import (
+    clear_textpath_cache,
+    disable_textpath_cache,
+    enable_textpath_cache,
+    textpath_cache_info,
+)
+from helper_plot_hangul._tofu_audit import (
+    MissingGlyphError,
+    audit_figure_glyphs,
+    disable_tofu_audit,
+    enable_tofu_audit,
+)
 from helper_plot_hangul.helper_plot_hangul import (
     matplotlib_font_get,
     matplotlib_font_reset,
     matplotlib_font_set,
+    render_to_buffer,
 )
 
 __all__ = [
     "matplotlib_font_reset",
     "matplotlib_font_set",
     "matplotlib_font_get",
+    "render_to_buffer",
+    "clear_render_pool",
+    "render_pool_info",
     "matplotlib_font_resource",
+    "enable_glyph_cache",
+    "disable_glyph_cache",
+    "clear_glyph_cache",
+    "glyph_cache_info",
+    "enable_slim_font_manager",
+    "disable_slim_font_manager",
+    "slim_font_family_map",
+    "enable_textpath_cache",
+    "disable_textpath_cache",
+    "clear_textpath_cache",
+    "textpath_cache_info",
+    "enable_tofu_audit",
+    "disable_tofu_audit",
+    "audit_figure_glyphs",
+    "MissingGlyphError",
+    "enable_font_watch",
+    "disable_font_watch",
+    "poll_font_dirs",
+    "write_pdf_report",
+    "hangul_text_collection",
+    "measure_text_width",
+    "truncate_texts",
+    "wrap_texts",
     "__version__",
 ]
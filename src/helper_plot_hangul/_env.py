@@ -1,5 +1,7 @@
 """실행 환경 감지 유틸리티."""
 
+import sys
+
 
 def is_jupyter_environment() -> bool:
     """Jupyter/IPython 환경 여부 확인."""
@@ -11,10 +13,37 @@ def is_jupyter_environment() -> bool:
 
 
 def is_streamlit_environment() -> bool:
-    """Streamlit 환경 여부 확인."""
+    """Streamlit 환경 여부 확인 (Streamlit 스크립트 실행 스레드에서만 True)."""
+    if "streamlit" not in sys.modules:
+        return False
+    try:
+        # 모듈 위치가 버전마다 달라(script_run_context → scriptrunner_utils) 패키지 공개 이름 사용
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+        try:
+            return get_script_run_ctx(suppress_warning=True) is not None
+        except TypeError:
+            return get_script_run_ctx() is not None
+    except Exception:
+        return False
+
+
+def is_streamlit_server_running() -> bool:
+    """Streamlit 서버 런타임이 실행 중인지 확인 (호출 스레드와 무관)."""
+    if "streamlit" not in sys.modules:
+        return False
     try:
-        import streamlit.runtime.scriptrunner.script_run_context as ctx
+        from streamlit import runtime
 
-        return ctx.get_script_run_ctx() is not None
+        return runtime.exists()
     except Exception:
         return False
+
+
+def streamlit_session_state():
+    """현재 Streamlit 세션의 session_state 반환 (Streamlit 스크립트 스레드가 아니면 None)."""
+    if not is_streamlit_environment():
+        return None
+    import streamlit as st
+
+    return st.session_state
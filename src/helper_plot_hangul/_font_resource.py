@@ -1,10 +1,27 @@
+import atexit
 import importlib.resources as resources
+import os
 import sys
+import threading
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
 
 from helper_plot_hangul._logger import logger
 
 
+class _Snapshot(NamedTuple):
+    """레지스트리 상태의 불변 스냅샷 (교체만 하고 수정하지 않음)."""
+
+    # {family_name: ttf_filename} 매핑
+    registry: Mapping[str, str]
+    # {family_name: resolved_absolute_path}
+    resolved: Mapping[str, str]
+
+
+_EMPTY = MappingProxyType({})
+
+
 class MatplotlibFontResource:
     """패키지 동봉 폰트의 family-path 매핑 레지스트리.
 
@@ -12,6 +29,9 @@ class MatplotlibFontResource:
     모듈 임포트 시 자동으로 load_all()이 호출되므로, 등록된 폰트는
     plt.rc('font', family='...') 로 바로 사용할 수 있습니다.
 
+    스레드 안전: 상태는 불변 스냅샷(copy-on-write)으로 보관합니다. path_of(), families() 등
+    읽기는 잠금 없이 현재 스냅샷을 참조하고, 쓰기는 잠금으로 직렬화한 뒤 새 스냅샷으로 교체합니다.
+
     Examples
     --------
     >>> matplotlib_font_resource.register('MyFont', 'MyFont.ttf')
@@ -21,12 +41,30 @@ class MatplotlibFontResource:
     """
 
     def __init__(self) -> None:
-        # {family_name: ttf_filename} 매핑
-        self._registry: dict[str, str] = {}
-        # {family_name: resolved_absolute_path}
-        self._resolved: dict[str, str] = {}
-        # ZIP 배포 환경에서 컨텍스트 수명 유지
-        self._contexts: list = []
+        self._snapshot = _Snapshot(_EMPTY, _EMPTY)
+        # 쓰기 직렬화 (load_all 이 내부에서 _resolve_path 를 호출하므로 재진입 가능)
+        self._lock = threading.RLock()
+        # {family_name: as_file 컨텍스트} ZIP 배포 환경에서 임시 파일 수명 유지
+        self._contexts: dict = {}
+        # {폰트 폴더 절대 경로: {TTF 절대 경로: (st_mtime_ns, st_size)}} — register_fonts_dir 시점 지문
+        self._font_dirs: dict = {}
+        atexit.register(self.close)
+
+    @property
+    def _registry(self) -> Mapping[str, str]:
+        return self._snapshot.registry
+
+    @property
+    def _resolved(self) -> Mapping[str, str]:
+        return self._snapshot.resolved
+
+    def _publish(self, registry: dict | None = None, resolved: dict | None = None) -> None:
+        """새 스냅샷으로 교체 (잠금 보유 상태에서 호출)."""
+        current = self._snapshot
+        self._snapshot = _Snapshot(
+            current.registry if registry is None else MappingProxyType(registry),
+            current.resolved if resolved is None else MappingProxyType(resolved),
+        )
 
     def register(self, family: str, ttf_filename: str) -> None:
         """폰트 패밀리 이름과 TTF 파일명을 레지스트리에 등록.
@@ -36,54 +74,115 @@ class MatplotlibFontResource:
         family : str
             matplotlib에서 사용할 폰트 패밀리 이름 (예: 'NanumBarunGothic')
         ttf_filename : str
-            패키지 fonts/ 폴더 내 TTF 파일명 (예: 'NanumBarunGothic.ttf')
+            패키지 fonts/ 폴더 내 TTF 파일명 (예: 'NanumBarunGothic.ttf') 또는
+            외부 폴더 TTF 파일의 절대 경로
         """
-        self._registry[family] = ttf_filename
-        self._resolved.pop(family, None)
+        with self._lock:
+            resolved = dict(self._snapshot.resolved)
+            resolved.pop(family, None)
+            self._publish({**self._snapshot.registry, family: ttf_filename}, resolved)
+            self._release_context(family)
         logger.debug(f"폰트 등록: {family} -> {ttf_filename}")
 
+    def unregister(self, family: str) -> None:
+        """레지스트리에서 폰트 패밀리 제거 (fontManager 항목은 remove_font() 로 별도 제거).
+
+        Parameters
+        ----------
+        family : str
+            제거할 폰트 패밀리 이름 (미등록이면 무시)
+        """
+        with self._lock:
+            registry = dict(self._snapshot.registry)
+            if registry.pop(family, None) is None:
+                return
+            resolved = dict(self._snapshot.resolved)
+            resolved.pop(family, None)
+            self._publish(registry, resolved)
+            self._release_context(family)
+        logger.debug(f"폰트 등록 해제: {family}")
+
     def _resolve_path(self, family: str) -> str | None:
-        """등록된 폰트의 실제 파일 경로를 반환 (캐시 우선)."""
-        if family in self._resolved:
-            p = self._resolved[family]
-            if Path(p).exists():
-                return p
-            self._resolved.pop(family)
-
-        ttf_filename = self._registry.get(family)
-        if ttf_filename is None:
+        """등록된 폰트의 실제 파일 경로를 반환 (캐시 우선, 캐시 적중 시 잠금 없음)."""
+        snapshot = self._snapshot
+        if snapshot.registry.get(family) is None:
             return None
+        p = snapshot.resolved.get(family)
+        if p is not None and Path(p).exists():
+            return p
+
+        with self._lock:
+            snapshot = self._snapshot
+            p = snapshot.resolved.get(family)
+            if p is not None:
+                if Path(p).exists():
+                    return p
+                resolved = dict(snapshot.resolved)
+                resolved.pop(family)
+                self._publish(resolved=resolved)
+                self._release_context(family)
+
+            ttf_filename = snapshot.registry.get(family)
+            if ttf_filename is None:
+                return None
+
+            resolved_path = self._locate(family, ttf_filename)
+            if resolved_path is not None:
+                self._publish(resolved={**self._snapshot.resolved, family: resolved_path})
+            return resolved_path
+
+    def _locate(self, family: str, ttf_filename: str) -> str | None:
+        """TTF 파일명을 실제 파일 경로로 변환 (잠금 보유 상태에서 호출)."""
+        # 0. 외부 폴더: 절대 경로로 등록된 파일
+        if os.path.isabs(ttf_filename):
+            return ttf_filename if os.path.exists(ttf_filename) else None
 
         # 1. 개발 환경: 패키지 소스 fonts/ 폴더
         local_path = Path(__file__).parent / "fonts" / ttf_filename
         if local_path.exists():
-            resolved = str(local_path.resolve())
-            self._resolved[family] = resolved
-            return resolved
+            return str(local_path.resolve())
 
         # 2. pip 설치 환경: importlib.resources
         try:
             pkg_path = resources.files("helper_plot_hangul").joinpath(f"fonts/{ttf_filename}")
             ctx = resources.as_file(pkg_path)
             real_path = ctx.__enter__()
-            self._contexts.append(ctx)
-            resolved = str(real_path.resolve())
-            self._resolved[family] = resolved
-            return resolved
+            self._contexts[family] = ctx
+            return str(real_path.resolve())
         except Exception:
             return None
 
+    def _release_context(self, family: str) -> None:
+        """family 의 as_file 컨텍스트를 종료하여 임시 파일 해제."""
+        ctx = self._contexts.pop(family, None)
+        if ctx is not None:
+            try:
+                ctx.__exit__(None, None, None)
+            except Exception as e:
+                logger.debug(f"폰트 임시 파일 해제 실패 (무시): {family} ({e})")
+
+    def close(self) -> None:
+        """모든 as_file 컨텍스트를 종료하고 경로 캐시를 비움 (프로세스 종료 시 자동 호출).
+
+        등록 정보는 유지되며, 이후 path_of() 호출 시 경로를 다시 해석합니다.
+        """
+        with self._lock:
+            for family in list(self._contexts):
+                self._release_context(family)
+            self._publish(resolved={})
+
     def load_all(self) -> None:
         """등록된 모든 폰트를 matplotlib fontManager에 addfont로 일괄 등록."""
-        import matplotlib.font_manager as _fm
-
-        for family in list(self._registry):
-            path = self._resolve_path(family)
-            if path:
-                _fm.fontManager.addfont(path)
-                logger.debug(f"fontManager 등록 완료: {family} ({path})")
-            else:
-                logger.warning(f"폰트 파일을 찾을 수 없습니다: {family} ({self._registry[family]})")
+        # fontManager 자체는 스레드 안전하지 않으므로 등록 과정 전체를 직렬화
+        with self._lock:
+            registry = self._snapshot.registry
+            for family, ttf_filename in registry.items():
+                path = self._resolve_path(family)
+                if path:
+                    addfont_once(path)
+                    logger.debug(f"fontManager 등록 완료: {family} ({path})")
+                else:
+                    logger.warning(f"폰트 파일을 찾을 수 없습니다: {family} ({ttf_filename})")
 
     def path_of(self, family: str) -> str | None:
         """등록된 폰트의 절대 경로 반환. 미등록 또는 파일 없으면 None.
@@ -100,13 +199,36 @@ class MatplotlibFontResource:
         """
         return self._resolve_path(family)
 
+    def advance_table(self, family: str):
+        """등록된 폰트의 코드포인트 인덱스 진행폭 테이블 반환 (첫 호출 시 계산 후 디스크 캐시).
+
+        Parameters
+        ----------
+        family : str
+            등록된 폰트 패밀리 이름
+
+        Returns
+        -------
+        np.ndarray | None
+            table[codepoint] = 글자 크기 1 기준 진행폭 (em, float32). 폰트 파일이 없으면 None
+        """
+        from helper_plot_hangul._glyph_metrics import font_glyphs
+
+        path = self._resolve_path(family)
+        if path is None:
+            return None
+        return font_glyphs(path).table()
+
     def families(self) -> list[str]:
         """등록된 폰트 패밀리 이름 목록 반환."""
-        return list(self._registry.keys())
+        return list(self._snapshot.registry)
 
     def register_fonts_dir(self, fonts_dir: str | Path | None = None) -> list[str]:
         """fonts/ 폴더의 TTF 파일을 파일명(확장자 제외)을 family로 자동 등록.
 
+        패키지 외부 폴더의 파일은 절대 경로로 등록됩니다. 등록 시점의 파일 지문(수정 시각, 크기)을
+        기록하여 sync_fonts_dirs() 가 이후 변경분만 반영할 수 있게 합니다.
+
         Parameters
         ----------
         fonts_dir : str | Path | None
@@ -117,19 +239,120 @@ class MatplotlibFontResource:
         list[str]
             새로 등록된 폰트 패밀리 이름 목록
         """
+        package_dir = Path(__file__).parent / "fonts"
         if fonts_dir is None:
-            fonts_dir = Path(__file__).parent / "fonts"
-        fonts_dir = Path(fonts_dir)
+            fonts_dir = package_dir
+        directory = str(Path(fonts_dir).resolve())
+        external = directory != str(package_dir.resolve())
 
+        fingerprints = _scan_fonts_dir(directory)
         registered: list[str] = []
-        for ttf in sorted(fonts_dir.glob("*.ttf")):
-            family = ttf.stem
-            self.register(family, ttf.name)
-            registered.append(family)
+        for path in sorted(fingerprints):
+            ttf = Path(path)
+            self.register(ttf.stem, path if external else ttf.name)
+            registered.append(ttf.stem)
+        with self._lock:
+            self._font_dirs[directory] = fingerprints
 
         logger.debug(f"fonts/ 자동 등록 완료: {registered}")
         return registered
 
+    def font_dirs(self) -> list[str]:
+        """register_fonts_dir() 로 등록된 폰트 폴더 절대 경로 목록 반환."""
+        return list(self._font_dirs)
+
+    def sync_fonts_dirs(self) -> dict[str, list[str]]:
+        """등록된 폰트 폴더를 다시 스캔하여 추가/변경/삭제된 TTF 파일만 반영.
+
+        폴더별 파일 지문(수정 시각, 크기)을 이전 스캔과 비교하여, 추가/변경된 파일만
+        레지스트리와 fontManager 에 (재)등록하고 삭제된 파일은 양쪽에서 제거합니다.
+        변경이 없으면 파일 시스템 stat 외에는 아무 작업도 하지 않습니다.
+
+        Returns
+        -------
+        dict[str, list[str]]
+            - 'added' / 'changed' / 'removed': 해당 폰트 패밀리 이름 목록
+            - 'paths': 변경/삭제되어 관련 캐시를 무효화해야 하는 폰트 파일 경로 목록
+        """
+        delta: dict[str, list[str]] = {"added": [], "changed": [], "removed": [], "paths": []}
+        package_dir = str((Path(__file__).parent / "fonts").resolve())
+        # fontManager 자체는 스레드 안전하지 않으므로 반영 과정 전체를 직렬화
+        with self._lock:
+            for directory, old in list(self._font_dirs.items()):
+                new = _scan_fonts_dir(directory)
+                if new == old:
+                    continue
+                external = directory != package_dir
+                for path in sorted(new.keys() | old.keys()):
+                    if new.get(path) == old.get(path):
+                        continue
+                    ttf = Path(path)
+                    family = ttf.stem
+                    ref = path if external else ttf.name
+                    if path not in new:
+                        # 같은 이름이 다른 폴더 파일로 재등록된 경우는 유지
+                        if self._snapshot.registry.get(family) == ref:
+                            self.unregister(family)
+                        remove_font(path)
+                        delta["removed"].append(family)
+                        delta["paths"].append(path)
+                        continue
+                    self.register(family, ref)
+                    if path in old:
+                        remove_font(path)
+                        delta["changed"].append(family)
+                        delta["paths"].append(path)
+                    else:
+                        delta["added"].append(family)
+                    try:
+                        addfont_once(path)
+                    except Exception as e:
+                        logger.warning(f"폰트 파일을 읽을 수 없습니다: {path} ({e})")
+                self._font_dirs[directory] = new
+
+        if delta["added"] or delta["changed"] or delta["removed"]:
+            logger.debug(f"폰트 폴더 변경 반영: {delta}")
+        return delta
+
+
+def addfont_once(path: str) -> None:
+    """fontManager 에 같은 파일이 없을 때만 addfont (반복 호출 시 ttflist 중복 증가 방지)."""
+    import matplotlib.font_manager as _fm
+
+    if any(entry.fname == path for entry in _fm.fontManager.ttflist):
+        return
+    _fm.fontManager.addfont(path)
+
+
+def remove_font(path: str) -> None:
+    """fontManager 에서 path 파일의 폰트 항목을 모두 제거하고 findfont 캐시를 비움."""
+    import matplotlib.font_manager as _fm
+
+    mgr = _fm.fontManager
+    mgr.ttflist = [entry for entry in mgr.ttflist if entry.fname != path]
+    mgr.afmlist = [entry for entry in mgr.afmlist if entry.fname != path]
+    if hasattr(mgr, "_findfont_cached"):
+        mgr._findfont_cached.cache_clear()
+
+
+def _scan_fonts_dir(directory: str) -> dict:
+    """폴더의 TTF 파일 지문 {절대 경로: (st_mtime_ns, st_size)} 반환 (폴더가 없으면 빈 dict)."""
+    fingerprints = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # glob("*.ttf") 와 같이 숨김 파일(복사 중 임시 파일 등)은 제외
+                if entry.name.startswith(".") or not entry.name.endswith(".ttf"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                fingerprints[os.path.join(directory, entry.name)] = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        pass
+    return fingerprints
+
 
 # 기본 레지스트리 인스턴스 — fonts/ 폴더 TTF 파일 자동 등록
 matplotlib_font_resource = MatplotlibFontResource()
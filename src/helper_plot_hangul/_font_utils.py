@@ -1,29 +1,48 @@
 """내부 폰트 유틸리티: rcParams 재적용 및 matplotlib.style.use 패치."""
 
+from helper_plot_hangul._env import streamlit_session_state
+from helper_plot_hangul._font_resource import addfont_once, matplotlib_font_resource
 from helper_plot_hangul._logger import logger
 
 # 선호 폰트 저장소 (helper_plot_hangul 모듈 네임스페이스 대신 이 모듈이 상태 보유)
 _preferred_font_path: str | None = None
 _preferred_font_family: str | None = None
 _preferred_font_kwargs: dict = {}
-_style_patched: bool = False
+
+# Streamlit 세션별 선호 폰트 (font_path, font_family, font_kwargs) 를 보관하는 session_state 키
+_SESSION_KEY = "_helper_plot_hangul_preferred"
+# Streamlit 세션에서 선호 폰트로 지정된 적이 있는 폰트 경로 (렌더링 캐시 적용 대상)
+_session_font_paths: set = set()
+# (fontManager, {font_path: font_name}) — addfont/FontProperties 조회 결과 캐시
+_font_names: tuple = (None, {})
+
+
+def _font_name_of(font_path: str) -> str:
+    """폰트 파일을 fontManager 에 등록하고 패밀리 이름 반환 (fontManager 교체 전까지 캐시)."""
+    global _font_names
+    import matplotlib.font_manager as fm
+
+    manager, names = _font_names
+    if manager is not fm.fontManager:
+        manager, names = fm.fontManager, {}
+        _font_names = (manager, names)
+    name = names.get(font_path)
+    if name is None:
+        addfont_once(font_path)
+        name = names[font_path] = fm.FontProperties(fname=font_path).get_name()
+    return name
 
 
 def reapply_font_rcparams() -> None:
     """저장된 선호 폰트를 rcParams에 재적용 (스타일 적용 후 자동 호출)."""
     try:
-        import matplotlib.font_manager as fm
         import matplotlib.pyplot as _plt
 
-        font_path = _preferred_font_path
-        font_family = _preferred_font_family
-        kwargs = _preferred_font_kwargs
+        font_path, font_family, kwargs = get_preferred()
 
         if font_path:
             try:
-                fm.fontManager.addfont(font_path)
-                fp = fm.FontProperties(fname=font_path)
-                font_name = fp.get_name()
+                font_name = _font_name_of(font_path)
                 _plt.rcParams["font.family"] = font_name
                 logger.debug(f"폰트 재적용: {font_name} (경로: {font_path})")
             except Exception as e:
@@ -45,39 +64,115 @@ def set_preferred(
     font_path: str | None,
     font_family: str | None,
     font_kwargs: dict,
+    session: bool = True,
 ) -> None:
-    """선호 폰트 정보를 저장하고 rcParams에 즉시 적용."""
+    """선호 폰트 정보를 저장하고 rcParams에 즉시 적용.
+
+    Streamlit 스크립트 실행 중에는 현재 세션의 session_state 에 저장하여 세션 간 선호 폰트가
+    섞이지 않게 합니다. session=False 이면 항상 프로세스 기본값으로 저장합니다.
+    """
     global _preferred_font_path, _preferred_font_family, _preferred_font_kwargs
-    _preferred_font_path = font_path
-    _preferred_font_family = font_family
-    _preferred_font_kwargs = font_kwargs
+    state = streamlit_session_state() if session else None
+    if state is not None:
+        preferred = (font_path, font_family, font_kwargs)
+        # 재실행마다 같은 값을 다시 쓰지 않음 (session_state 쓰기는 위젯 상태 갱신을 동반)
+        if state.get(_SESSION_KEY) != preferred:
+            state[_SESSION_KEY] = preferred
+        if font_path:
+            _session_font_paths.add(font_path)
+    else:
+        _preferred_font_path = font_path
+        _preferred_font_family = font_family
+        _preferred_font_kwargs = font_kwargs
     reapply_font_rcparams()
 
 
 def get_preferred() -> tuple[str | None, str | None, dict]:
-    """저장된 선호 폰트 정보 반환."""
+    """저장된 선호 폰트 정보 반환 (Streamlit 세션 값이 있으면 우선)."""
+    state = streamlit_session_state()
+    if state is not None:
+        preferred = state.get(_SESSION_KEY)
+        if preferred is not None:
+            return preferred
     return _preferred_font_path, _preferred_font_family, _preferred_font_kwargs
 
 
+def hangul_font_paths() -> set:
+    """레지스트리 폰트와 선호 폰트의 파일 경로 집합 반환 (렌더링 캐시 적용 대상)."""
+    paths = set(matplotlib_font_resource._resolved.values())
+    if _preferred_font_path:
+        paths.add(_preferred_font_path)
+    paths.update(_session_font_paths)
+    return paths
+
+
+def _registered_hangul_font() -> str | None:
+    """한글('가')을 지원하는 첫 레지스트리 폰트 파일 경로 (없으면 None)."""
+    import matplotlib.font_manager as fm
+
+    for family in matplotlib_font_resource.families():
+        path = matplotlib_font_resource.path_of(family)
+        if path and fm.get_font(path).get_char_index(0xAC00):
+            return path
+    return None
+
+
+def preferred_font_file() -> str:
+    """선호 한글 폰트 파일 경로.
+
+    get_preferred() 의 경로, 레지스트리/시스템에서 찾은 선호 패밀리, 한글을 지원하는
+    레지스트리 폰트 순으로 찾고, 모두 없으면 matplotlib 기본 폰트를 반환합니다.
+    """
+    import matplotlib.font_manager as fm
+
+    font_path, font_family, _ = get_preferred()
+    if font_path:
+        return font_path
+    families = [font_family] if isinstance(font_family, str) else list(font_family or ())
+    for family in families:
+        path = matplotlib_font_resource.path_of(family)
+        if path:
+            return path
+        try:
+            return str(fm.findfont(fm.FontProperties(family=family), fallback_to_default=False))
+        except ValueError:
+            continue
+    path = _registered_hangul_font()
+    if path:
+        logger.debug(f"선호 폰트 {font_family!r} 없음, 레지스트리 한글 폰트 사용: {path}")
+        return path
+    return str(fm.findfont(fm.FontProperties()))
+
+
+def font_paths_for(prop) -> tuple:
+    """FontProperties 에 대해 렌더러가 사용할 폰트 파일 경로(폴백 포함) 반환."""
+    import matplotlib.font_manager as fm
+
+    if hasattr(fm.fontManager, "_find_fonts_by_props"):
+        return tuple(str(p) for p in fm.fontManager._find_fonts_by_props(prop))
+    return (str(fm.findfont(prop)),)
+
+
 def patch_style_use() -> None:
     """matplotlib.style.use를 패치하여 스타일 적용 후 자동으로 한글 폰트 재설정."""
-    global _style_patched
-    if _style_patched:
-        return
     try:
         import matplotlib.style as mstyle
 
+        # matplotlib_font_reset() 후에는 새로 로드된 모듈에 다시 패치해야 하므로 모듈 쪽 표식으로 판단
+        if getattr(mstyle.use, "_helper_plot_hangul_patched", False):
+            return
         _orig_style_use = mstyle.use
 
         def _patched_style_use(style, *args, **kwargs):
             result = _orig_style_use(style, *args, **kwargs)
-            if _preferred_font_path or _preferred_font_family:
+            font_path, font_family, _ = get_preferred()
+            if font_path or font_family:
                 reapply_font_rcparams()
                 logger.debug(f"스타일 '{style}' 적용 후 한글 폰트 자동 재설정 완료")
             return result
 
+        _patched_style_use._helper_plot_hangul_patched = True
         mstyle.use = _patched_style_use
-        _style_patched = True
         logger.debug("matplotlib.style.use 패치 완료")
 
     except Exception as e:
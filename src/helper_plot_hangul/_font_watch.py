@@ -0,0 +1,129 @@
+"""등록된 폰트 폴더 변경 감시 (폴링 방식).
+
+register_fonts_dir() 로 등록한 폴더의 TTF 파일 지문(수정 시각, 크기)을 주기적으로 비교하여
+추가/변경/삭제된 파일만 레지스트리와 fontManager 에 반영하고, 해당 폰트 파일을 참조하는
+캐시 항목만 무효화합니다. inotify 등 OS 이벤트 없이 동작하며 enable_font_watch() 로 명시적으로 켭니다.
+"""
+
+import threading
+
+from helper_plot_hangul import (
+    _font_utils,
+    _glyph_cache,
+    _glyph_metrics,
+    _textpath_cache,
+    _tofu_audit,
+)
+from helper_plot_hangul._font_resource import matplotlib_font_resource
+from helper_plot_hangul._logger import logger
+from helper_plot_hangul._slim_font_manager import apply_slim_font_manager
+
+_DEFAULT_INTERVAL = 5.0
+
+_lock = threading.Lock()
+_thread: threading.Thread | None = None
+_stop = threading.Event()
+
+
+def _invalidate(paths: list[str]) -> None:
+    """변경/삭제된 폰트 파일을 참조하는 캐시 항목만 제거."""
+    stale = set(paths)
+    if stale:
+        # 래스터 캐시 키는 (폴백 포함 폰트 경로 tuple, ...), 아웃라인 캐시 키는 (폰트 경로, ...)
+        _glyph_cache._cache.discard_where(lambda key: not stale.isdisjoint(key[0]))
+        _textpath_cache._cache.discard_where(lambda key: key[0] in stale)
+        for path in stale:
+            _glyph_metrics._fonts.pop(path, None)
+            _tofu_audit._cmap_cache.pop(path, None)
+            _font_utils._font_names[1].pop(path, None)
+
+        # matplotlib 의 FT2Font 객체 캐시는 항목별 제거를 지원하지 않으므로 전체를 비움 (지연 재생성)
+        import matplotlib.font_manager as fm
+
+        for name in ("_get_font", "get_font"):
+            cache_clear = getattr(getattr(fm, name, None), "cache_clear", None)
+            if cache_clear is not None:
+                cache_clear()
+
+    # 경량 모드이면 새로 추가된 폰트를 포함해 패밀리 맵 재구성 (비활성화 상태면 무시)
+    apply_slim_font_manager()
+
+
+def poll_font_dirs() -> dict[str, list[str]]:
+    """등록된 폰트 폴더를 한 번 검사하여 변경분을 반영.
+
+    감시 스레드 없이 요청 처리 전 등 원하는 시점에 직접 호출할 수도 있습니다.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        - 'added' / 'changed' / 'removed': 해당 폰트 패밀리 이름 목록
+        - 'paths': 캐시가 무효화된 폰트 파일 경로 목록
+
+    Examples
+    --------
+    >>> from helper_plot_hangul import matplotlib_font_resource, poll_font_dirs
+    >>> families = matplotlib_font_resource.register_fonts_dir("/srv/shared/fonts")
+    >>> poll_font_dirs()["added"]
+    []
+    """
+    delta = matplotlib_font_resource.sync_fonts_dirs()
+    if delta["added"] or delta["changed"] or delta["removed"]:
+        _invalidate(delta["paths"])
+        logger.info(
+            f"폰트 폴더 변경 반영: 추가 {delta['added']}, "
+            f"변경 {delta['changed']}, 삭제 {delta['removed']}"
+        )
+    return delta
+
+
+def _watch_loop(interval: float) -> None:
+    while not _stop.wait(interval):
+        try:
+            poll_font_dirs()
+        except Exception as e:
+            logger.warning(f"폰트 폴더 검사 실패 (다음 주기에 재시도): {e}")
+
+
+def enable_font_watch(interval: float = _DEFAULT_INTERVAL) -> None:
+    """등록된 폰트 폴더 변경 감시 활성화 (백그라운드 데몬 스레드에서 주기적으로 poll_font_dirs 실행).
+
+    Parameters
+    ----------
+    interval : float
+        폴더 검사 주기 (초, 기본값: 5.0). 이미 감시 중이면 새 주기로 다시 시작합니다.
+
+    Notes
+    -----
+    감시 대상은 matplotlib_font_resource.register_fonts_dir() 로 등록한 폴더이며,
+    패밀리 이름은 등록 시와 같이 파일명(확장자 제외)입니다. 파일 지문은 폴더마다
+    os.scandir 한 번과 파일별 stat 만으로 계산하므로 변경이 없을 때의 비용은 매우 작습니다.
+
+    Examples
+    --------
+    >>> from helper_plot_hangul import enable_font_watch, matplotlib_font_resource
+    >>> families = matplotlib_font_resource.register_fonts_dir("/srv/shared/fonts")
+    >>> enable_font_watch(interval=10)
+    """
+    global _thread
+    if interval <= 0:
+        raise ValueError(f"interval 은 0 보다 커야 합니다: {interval!r}")
+    disable_font_watch()
+    with _lock:
+        _stop.clear()
+        _thread = threading.Thread(
+            target=_watch_loop, args=(interval,), name="helper_plot_hangul-font-watch", daemon=True
+        )
+        _thread.start()
+    logger.debug(f"폰트 폴더 감시 시작: {matplotlib_font_resource.font_dirs()} ({interval}초 주기)")
+
+
+def disable_font_watch() -> None:
+    """폰트 폴더 변경 감시 중지 (감시 중이 아니면 무시)."""
+    global _thread
+    with _lock:
+        thread, _thread = _thread, None
+        _stop.set()
+    if thread is not None and thread is not threading.current_thread():
+        thread.join()
+        logger.debug("폰트 폴더 감시 중지")
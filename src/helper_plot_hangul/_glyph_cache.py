@@ -0,0 +1,204 @@
+"""Agg 백엔드용 한글 텍스트 래스터 캐시.
+
+FreeType 래스터화 결과(그레이스케일 비트맵)를 프로세스 전역 LRU 캐시에 보관하여
+같은 한글 문자열을 반복해서 그릴 때 재래스터화를 생략합니다.
+RendererAgg.draw_text 를 패치하는 방식이며 enable_glyph_cache() 로 명시적으로 켭니다.
+"""
+
+import math
+
+from helper_plot_hangul._font_utils import font_paths_for, hangul_font_paths
+from helper_plot_hangul._logger import logger
+from helper_plot_hangul._lru import ByteBoundedLRU
+
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_enabled: bool = False
+_all_fonts: bool = False
+
+
+def _entry_nbytes(entry) -> int:
+    """캐시 항목의 비트맵 총 바이트 (문자열 비트맵 또는 글리프 비트맵 목록)."""
+    if isinstance(entry[0], tuple):
+        return sum(buffer.nbytes for buffer, _, _ in entry)
+    return entry[0].nbytes
+
+
+# matplotlib < 3.11: {(font_paths, text, size, dpi, hinting, antialiased): (image, xo, yo, descent)}
+# matplotlib >= 3.11: {(..., antialiased, 원점 x/y 의 1/64px 소수부): ((buffer, left, top), ...)}
+_cache = ByteBoundedLRU(_DEFAULT_MAX_BYTES, sizeof=_entry_nbytes)
+
+
+def _rasterize_string(renderer, s, prop, flags, antialiased) -> tuple:
+    """문자열 전체를 하나의 비트맵으로 래스터화 (matplotlib < 3.11 의 draw_text 와 동일)."""
+    font = renderer._prepare_font(prop)
+    # 회전은 draw_text_image 에서 래스터 공간으로 처리하므로 angle=0 으로 래스터화
+    font.set_text(s, 0, flags=flags)
+    font.draw_glyphs_to_bitmap(antialiased=antialiased)
+    xo, yo = font.get_bitmap_offset()
+    return (font.get_image().copy(), xo / 64.0, yo / 64.0, font.get_descent() / 64.0)
+
+
+def _rasterize_glyphs(renderer, s, prop, flags, antialiased, phase_x, phase_y) -> tuple:
+    """글리프별 비트맵과 정수 원점 기준 위치 반환 (matplotlib >= 3.11 의 draw_text 와 동일).
+
+    글리프 위치는 1/64px 단위이므로 원점의 소수부(phase_x, phase_y)만 반영하여 래스터화하면
+    정수 픽셀 이동만으로 원래 출력과 같은 비트맵이 됩니다.
+    """
+    import numpy as np
+    from matplotlib.ft2font import RenderMode
+
+    font = renderer._prepare_font(prop)
+    size = prop.get_size_in_points()
+    mode = RenderMode.NORMAL if antialiased else RenderMode.MONO
+    identity = np.array([[0x10000, 0], [0, 0x10000]])
+    glyphs = []
+    for item in font._layout(s, flags=flags, features=None, language=None):
+        ft_object = item.ft_object
+        ft_object.set_size(size, renderer.dpi)
+        ft_object._set_transform(
+            identity, [phase_x + round(0x40 * item.x), phase_y + round(0x40 * item.y)]
+        )
+        bitmap = ft_object._render_glyph(item.glyph_index, flags, mode)
+        buffer = np.array(bitmap.buffer)
+        if not antialiased:
+            buffer *= 0xFF
+        glyphs.append((buffer, bitmap.left, bitmap.top))
+    return tuple(glyphs)
+
+
+def _make_cached_draw_text(renderer_cls):
+    """RendererAgg.draw_text 를 감싸는 캐시 적용 함수 생성."""
+    from matplotlib.backends.backend_agg import get_hinting_flag
+
+    orig_draw_text = renderer_cls.draw_text
+    # matplotlib < 3.11 은 문자열 비트맵을 통째로 회전 출력하므로 회전 텍스트도 동일 결과를 보장.
+    # 이후 버전은 글리프 단위로 서브픽셀 위치에 래스터화하므로 글리프 비트맵을 캐시하고,
+    # 회전 텍스트는 원래 경로로 처리.
+    legacy = not hasattr(renderer_cls, "_draw_text_glyphs_and_boxes")
+
+    def draw_text(self, gc, x, y, s, prop, angle, ismath=False, mtext=None):
+        if not _enabled or ismath or not s or (angle % 360 and not legacy):
+            return orig_draw_text(self, gc, x, y, s, prop, angle, ismath=ismath, mtext=mtext)
+        if mtext is not None and (
+            getattr(mtext, "get_fontfeatures", lambda: None)() is not None
+            or getattr(mtext, "get_language", lambda: None)() is not None
+        ):
+            return orig_draw_text(self, gc, x, y, s, prop, angle, ismath=ismath, mtext=mtext)
+
+        font_paths = font_paths_for(prop)
+        if not _all_fonts and font_paths[0] not in hangul_font_paths():
+            return orig_draw_text(self, gc, x, y, s, prop, angle, ismath=ismath, mtext=mtext)
+
+        flags = get_hinting_flag()
+        antialiased = bool(gc.get_antialiased())
+        key = (font_paths, s, prop.get_size_in_points(), self.dpi, flags, antialiased)
+
+        if legacy:
+            entry = _cache.get(key)
+            if entry is None:
+                entry = _rasterize_string(self, s, prop, flags, antialiased)
+                _cache.put(key, entry)
+            image, xo, yo, d = entry
+            xd = d * math.sin(math.radians(angle))
+            yd = d * math.cos(math.radians(angle))
+            self._renderer.draw_text_image(
+                image, round(x + xo + xd), round(y + yo + yd) + 1, angle, gc
+            )
+            return
+
+        # FreeType 좌표(y 위쪽)의 원점을 1/64px 단위로 정수부와 소수부로 분리
+        origin_x = round(0x40 * x)
+        origin_y = round(0x40 * (self.height - y))
+        key += (origin_x % 0x40, origin_y % 0x40)
+        glyphs = _cache.get(key)
+        if glyphs is None:
+            glyphs = _rasterize_glyphs(
+                self, s, prop, flags, antialiased, origin_x % 0x40, origin_y % 0x40
+            )
+            _cache.put(key, glyphs)
+        left0, top0 = origin_x // 0x40, origin_y // 0x40
+        height = int(self.height)
+        for buffer, left, top in glyphs:
+            # draw_text_image 의 y 는 아래쪽 기준 비트맵 하단
+            self._renderer.draw_text_image(
+                buffer, left0 + left, height - (top0 + top) + buffer.shape[0], 0, gc
+            )
+
+    draw_text._helper_plot_hangul_cached = True
+    draw_text.__wrapped__ = orig_draw_text
+    return draw_text
+
+
+def install_glyph_cache() -> None:
+    """현재 로드된 RendererAgg 에 캐시 패치 적용 (활성화 상태에서만, 중복 적용 방지).
+
+    matplotlib_font_reset() 이 matplotlib 모듈을 재로드한 뒤에도 호출됩니다.
+    """
+    if not _enabled:
+        return
+    try:
+        from matplotlib.backends.backend_agg import RendererAgg
+
+        if getattr(RendererAgg.draw_text, "_helper_plot_hangul_cached", False):
+            return
+        RendererAgg.draw_text = _make_cached_draw_text(RendererAgg)
+        logger.debug("RendererAgg.draw_text 래스터 캐시 패치 완료")
+    except Exception as e:
+        logger.debug(f"RendererAgg.draw_text 패치 실패 (무시): {e}")
+
+
+def enable_glyph_cache(max_bytes: int = _DEFAULT_MAX_BYTES, all_fonts: bool = False) -> None:
+    """Agg 한글 텍스트 래스터 캐시 활성화.
+
+    Parameters
+    ----------
+    max_bytes : int
+        캐시에 보관할 비트맵 총 바이트 상한 (초과 시 LRU 제거, 기본값: 64MB)
+    all_fonts : bool
+        True 이면 레지스트리/선호 폰트 외의 모든 폰트에도 캐시 적용
+
+    Notes
+    -----
+    캐시 키는 (폰트 경로, 문자열, 크기, dpi, 힌팅, 안티앨리어싱) 입니다. matplotlib 3.11 이상은
+    글리프를 1/64px 서브픽셀 위치에 래스터화하므로 출력 원점의 소수부도 키에 포함하며,
+    캐시 적중 시에도 캐시하지 않은 출력과 픽셀 단위로 같습니다. 수식(mathtext)과 폰트
+    feature/language 지정 텍스트, matplotlib 3.11 이상의 회전 텍스트는 캐시하지 않습니다.
+
+    Examples
+    --------
+    >>> from helper_plot_hangul import enable_glyph_cache
+    >>> enable_glyph_cache(max_bytes=32 * 1024 * 1024)
+    """
+    global _enabled, _all_fonts
+    _cache.resize(max_bytes)
+    _all_fonts = all_fonts
+    _enabled = True
+    install_glyph_cache()
+
+
+def disable_glyph_cache() -> None:
+    """래스터 캐시 비활성화 및 보관 중인 비트맵 해제."""
+    global _enabled
+    _enabled = False
+    clear_glyph_cache()
+
+
+def clear_glyph_cache() -> None:
+    """보관 중인 비트맵과 통계 초기화."""
+    _cache.clear()
+
+
+def glyph_cache_info() -> dict:
+    """캐시 상태 반환.
+
+    Returns
+    -------
+    dict
+        - 'enabled': 활성화 여부
+        - 'entries': 보관 중인 비트맵 수
+        - 'bytes': 보관 중인 비트맵 총 바이트
+        - 'max_bytes': 바이트 상한
+        - 'hits' / 'misses': 조회 적중/실패 횟수
+    """
+    return {"enabled": _enabled, **_cache.info()}
@@ -0,0 +1,150 @@
+"""폰트별 글리프 진행폭(advance)/아웃라인 캐시.
+
+모든 값은 em 단위(글자 크기 1 기준)로 보관하여 글자 크기, dpi 와 무관하게 재사용합니다.
+진행폭은 코드포인트로 바로 인덱싱하는 NumPy 테이블로 미리 계산하고 디스크에 캐시합니다.
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from helper_plot_hangul._logger import logger
+
+# 아웃라인/진행폭 추출 기준 크기 (TextToPath.FONT_SCALE 과 동일)
+_FONT_SCALE = 100.0
+# 진행폭 테이블 버전 (계산 방식이 바뀌면 증가시켜 디스크 캐시 무효화)
+_TABLE_VERSION = 1
+# 밀집 테이블 최대 크기 (BMP). 그 이상의 코드포인트는 개별 조회
+_TABLE_LIMIT = 0x10000
+
+_lock = threading.Lock()
+# {font_path: _FontGlyphs}
+_fonts: dict = {}
+
+
+def _no_hinting():
+    """FreeType NO_HINTING 로드 플래그 (matplotlib 버전별 상수 위치 차이 흡수)."""
+    from matplotlib import ft2font
+
+    if hasattr(ft2font, "LoadFlags"):
+        return ft2font.LoadFlags.NO_HINTING
+    return ft2font.LOAD_NO_HINTING
+
+
+class _FontGlyphs:
+    """단일 폰트 파일의 글리프 진행폭/아웃라인 캐시."""
+
+    def __init__(self, path: str) -> None:
+        from matplotlib.ft2font import FT2Font
+
+        self.path = path
+        self._font = FT2Font(path)
+        self._font.set_size(_FONT_SCALE, 72)
+        em = float(self._font.units_per_EM)
+        self.ascent = self._font.ascender / em
+        self.descent = -self._font.descender / em
+        # 코드포인트 인덱스 진행폭(em) 테이블 (첫 사용 시 로드)
+        self._table: np.ndarray | None = None
+        # {codepoint: advance(em)} — 테이블 범위를 벗어난 코드포인트
+        self._extra: dict = {}
+        # {codepoint: (verts(em), codes)}
+        self._outlines: dict = {}
+
+    def _load(self, cp: int):
+        """코드포인트의 글리프 로드 (cmap 에 없으면 .notdef 글리프)."""
+        return self._font.load_glyph(self._font.get_char_index(cp), flags=_no_hinting())
+
+    def _advance_of(self, cp: int) -> float:
+        return self._load(cp).linearHoriAdvance / 65536.0 / _FONT_SCALE
+
+    def _cache_file(self) -> Path:
+        """진행폭 테이블 디스크 캐시 경로 (폰트 경로/크기/수정 시각 기준)."""
+        import matplotlib as mpl
+
+        stat = os.stat(self.path)
+        digest = hashlib.sha1(
+            f"{self.path}|{stat.st_size}|{stat.st_mtime_ns}|{_TABLE_VERSION}".encode()
+        ).hexdigest()[:16]
+        return Path(mpl.get_cachedir(), "helper_plot_hangul", f"advances-{digest}.npy")
+
+    def _build_table(self) -> np.ndarray:
+        """cmap 전체의 진행폭을 계산. cmap 에 없는 코드포인트는 .notdef 진행폭."""
+        bmp = [cp for cp in self._font.get_charmap() if cp < _TABLE_LIMIT]
+        notdef = self._font.load_glyph(0, flags=_no_hinting())
+        table = np.full(max(bmp, default=0) + 1, notdef.linearHoriAdvance / 65536.0 / _FONT_SCALE)
+        for cp in bmp:
+            table[cp] = self._advance_of(cp)
+        return table.astype(np.float32)
+
+    def table(self) -> np.ndarray:
+        """코드포인트 인덱스 진행폭(em) 테이블 반환 (메모리 → 디스크 캐시 → 계산 순)."""
+        if self._table is not None:
+            return self._table
+        with _lock:
+            if self._table is not None:
+                return self._table
+            cache_file = None
+            try:
+                cache_file = self._cache_file()
+                self._table = np.load(cache_file)
+                logger.debug(f"진행폭 테이블 디스크 캐시 사용: {cache_file}")
+                return self._table
+            except Exception:
+                pass
+            table = self._build_table()
+            if cache_file is not None:
+                try:
+                    cache_file.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = cache_file.with_suffix(f".{os.getpid()}.tmp.npy")
+                    np.save(tmp, table)
+                    os.replace(tmp, cache_file)
+                except OSError as e:
+                    logger.debug(f"진행폭 테이블 디스크 캐시 저장 실패 (무시): {e}")
+            self._table = table
+            return table
+
+    def advances(self, codepoints: np.ndarray) -> np.ndarray:
+        """코드포인트 배열의 진행폭(em) 배열 반환 (테이블 인덱싱, 범위 밖만 개별 조회)."""
+        table = self.table()
+        codepoints = np.asarray(codepoints, dtype=np.int64)
+        inside = codepoints < len(table)
+        result = np.empty(len(codepoints), dtype=np.float64)
+        result[inside] = table[codepoints[inside]]
+        if not inside.all():
+            with _lock:
+                for i in np.flatnonzero(~inside):
+                    cp = int(codepoints[i])
+                    if cp not in self._extra:
+                        self._extra[cp] = self._advance_of(cp)
+                    result[i] = self._extra[cp]
+        return result
+
+    def outline(self, cp: int) -> tuple:
+        """코드포인트의 글리프 아웃라인 (verts(em), codes) 반환."""
+        outline = self._outlines.get(cp)
+        if outline is None:
+            with _lock:
+                self._load(cp)
+                verts, codes = self._font.get_path()
+                outline = (np.asarray(verts, dtype=np.float64) / _FONT_SCALE, np.asarray(codes))
+                self._outlines[cp] = outline
+        return outline
+
+
+def font_glyphs(path: str) -> _FontGlyphs:
+    """폰트 파일의 글리프 캐시 반환 (프로세스 전역 공유)."""
+    glyphs = _fonts.get(path)
+    if glyphs is None:
+        with _lock:
+            glyphs = _fonts.get(path)
+            if glyphs is None:
+                glyphs = _fonts[path] = _FontGlyphs(path)
+    return glyphs
+
+
+def to_codepoints(s: str) -> np.ndarray:
+    """문자열을 코드포인트(uint32) 배열로 변환."""
+    return np.frombuffer(s.encode("utf-32-le"), dtype=np.uint32)
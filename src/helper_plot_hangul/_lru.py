@@ -0,0 +1,88 @@
+"""바이트 상한 기반 스레드 안전 LRU 캐시 (래스터/아웃라인 캐시 공용)."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+class ByteBoundedLRU:
+    """항목별 바이트 크기 합계가 max_bytes 를 넘지 않도록 유지하는 LRU 캐시.
+
+    Parameters
+    ----------
+    max_bytes : int
+        보관 항목 총 바이트 상한
+    sizeof : Callable[[Any], int]
+        값의 바이트 크기를 계산하는 함수
+    """
+
+    def __init__(self, max_bytes: int, sizeof: Callable[[Any], int]) -> None:
+        self._data: "OrderedDict[Any, tuple[Any, int]]" = OrderedDict()
+        self._sizeof = sizeof
+        self._lock = threading.Lock()
+        self.max_bytes = int(max_bytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Any) -> Any:
+        """값 조회 (적중 시 LRU 순서 갱신). 없으면 None."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key: Any, value: Any) -> None:
+        """값 저장 후 상한 초과분을 오래된 항목부터 제거. 단일 항목이 상한보다 크면 저장하지 않음."""
+        nbytes = self._sizeof(value)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._data:
+                return
+            self._data[key] = (value, nbytes)
+            self.nbytes += nbytes
+            self._evict()
+
+    def resize(self, max_bytes: int) -> None:
+        """바이트 상한 변경 (초과분 즉시 제거)."""
+        with self._lock:
+            self.max_bytes = int(max_bytes)
+            self._evict()
+
+    def discard_where(self, predicate: Callable[[Any], bool]) -> int:
+        """키가 predicate 를 만족하는 항목 제거 후 제거 개수 반환 (통계 유지)."""
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                _, nbytes = self._data.pop(key)
+                self.nbytes -= nbytes
+            return len(keys)
+
+    def clear(self) -> None:
+        """모든 항목과 통계 초기화."""
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict:
+        """항목 수, 바이트, 상한, 적중/실패 횟수 반환."""
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "bytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _evict(self) -> None:
+        while self._data and self.nbytes > self.max_bytes:
+            _, (_, nbytes) = self._data.popitem(last=False)
+            self.nbytes -= nbytes
@@ -0,0 +1,95 @@
+"""웹 서빙용 Agg 렌더러 풀.
+
+요청마다 FigureCanvasAgg 가 새 RendererAgg(픽셀 버퍼 + MathTextParser)를 만드는 대신,
+같은 크기(width, height, dpi)의 렌더러를 프로세스 전역 풀에서 빌려 쓰고 돌려줍니다.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+
+from helper_plot_hangul._logger import logger
+
+# 풀 전체 보관 렌더러 수 상한
+_MAX_RENDERERS = 8
+# 크기별 보관 렌더러 수 상한 (동시 요청 수만큼만 유지)
+_MAX_PER_KEY = 2
+
+_lock = threading.Lock()
+# {(width, height, dpi): [RendererAgg, ...]} — 최근 반환된 크기가 뒤쪽
+_pool: OrderedDict = OrderedDict()
+_stats = {"hits": 0, "misses": 0}
+
+
+def acquire(key: tuple):
+    """key=(width, height, dpi) 렌더러를 풀에서 꺼내거나 새로 생성."""
+    with _lock:
+        renderers = _pool.get(key)
+        if renderers:
+            _stats["hits"] += 1
+            renderer = renderers.pop()
+            if not renderers:
+                del _pool[key]
+            return renderer
+        _stats["misses"] += 1
+    from matplotlib.backends.backend_agg import RendererAgg
+
+    width, height, dpi = key
+    return RendererAgg(width, height, dpi)
+
+
+def _is_current(renderer) -> bool:
+    """렌더러가 현재 로드된 backend_agg 모듈의 RendererAgg 인스턴스인지 확인."""
+    backend = sys.modules.get("matplotlib.backends.backend_agg")
+    return backend is not None and isinstance(renderer, backend.RendererAgg)
+
+
+def release(key: tuple, renderer) -> None:
+    """사용이 끝난 렌더러를 풀에 반환 (상한 초과 시 가장 오래 쓰지 않은 크기부터 제거).
+
+    matplotlib_font_reset() 이전 모듈에서 만든 렌더러(예: 재설정 뒤에 해제된 RGBA 배열의
+    렌더러)는 풀에 넣지 않고 버립니다.
+    """
+    if not _is_current(renderer):
+        logger.debug("이전 matplotlib 모듈의 렌더러는 풀에 반환하지 않음")
+        return
+    with _lock:
+        renderers = _pool.setdefault(key, [])
+        _pool.move_to_end(key)
+        if len(renderers) < _MAX_PER_KEY:
+            renderers.append(renderer)
+        total = sum(len(r) for r in _pool.values())
+        while total > _MAX_RENDERERS and _pool:
+            _, evicted = _pool.popitem(last=False)
+            total -= len(evicted)
+
+
+def clear_render_pool() -> None:
+    """보관 중인 렌더러와 통계 초기화.
+
+    matplotlib_font_reset() 이 matplotlib 모듈을 재로드할 때도 호출되어 이전 모듈의 렌더러를 해제합니다.
+    """
+    with _lock:
+        _pool.clear()
+        _stats["hits"] = _stats["misses"] = 0
+    logger.debug("Agg 렌더러 풀 초기화")
+
+
+def render_pool_info() -> dict:
+    """풀 상태 반환.
+
+    Returns
+    -------
+    dict
+        - 'renderers': 보관 중인 렌더러 수
+        - 'sizes': 보관 중인 (width, height, dpi) 목록
+        - 'max_renderers': 보관 렌더러 수 상한
+        - 'hits' / 'misses': 풀 재사용/신규 생성 횟수
+    """
+    with _lock:
+        return {
+            "renderers": sum(len(r) for r in _pool.values()),
+            "sizes": list(_pool),
+            "max_renderers": _MAX_RENDERERS,
+            **_stats,
+        }
@@ -0,0 +1,83 @@
+"""한글 다중 페이지 PDF 리포트 스트리밍 작성기."""
+
+import gc
+import os
+from typing import Any, Callable, Iterable
+
+from helper_plot_hangul._font_utils import get_preferred
+from helper_plot_hangul._logger import logger
+
+
+def write_pdf_report(
+    path: str | os.PathLike,
+    builders: Iterable[Callable[[Any], Any]],
+    *,
+    figsize: tuple[float, float] | None = None,
+    metadata: dict | None = None,
+    gc_every: int = 100,
+    **savefig_kwargs: Any,
+) -> int:
+    """그림 생성 함수들을 한 페이지씩 렌더링하여 단일 PDF 로 스트리밍 저장.
+
+    페이지마다 pyplot 에 등록되지 않은 새 Figure 를 만들어 builder 에 전달하고,
+    저장 직후 참조를 끊어 해제하므로 페이지 수와 무관하게 메모리 사용량이 일정합니다.
+    PDF 폰트는 문서 전체에서 사용된 글리프만 모아 종료 시 한 번만 임베딩됩니다.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        저장할 PDF 파일 경로
+    builders : Iterable[Callable[[Figure], Any]]
+        페이지별 그림 생성 함수 (제너레이터 가능). 전달받은 Figure 에 그리거나,
+        다른 Figure 를 반환하면 반환된 Figure 를 저장합니다.
+    figsize : tuple[float, float] | None
+        페이지 Figure 크기 (인치). None 이면 rcParams['figure.figsize']
+    metadata : dict | None
+        PDF 메타데이터 (PdfPages 에 전달)
+    gc_every : int
+        순환 참조 해제를 위해 gc.collect() 를 호출할 페이지 간격 (0 이면 호출 안 함)
+    **savefig_kwargs
+        PdfPages.savefig 에 전달할 추가 인자
+
+    Returns
+    -------
+    int
+        저장된 페이지 수
+
+    Examples
+    --------
+    >>> def pages():
+    ...     for region in ["서울", "부산", "대구"]:
+    ...         def build(fig, region=region):
+    ...             ax = fig.subplots()
+    ...             ax.plot([1, 2, 3])
+    ...             ax.set_title(f"{region} 월간 매출")
+    ...         yield build
+    >>> write_pdf_report("report.pdf", pages())
+    3
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+    from matplotlib.figure import Figure
+
+    font_path, font_family, _ = get_preferred()
+    if font_path is None and font_family is None:
+        logger.warning(
+            "선호 한글 폰트가 설정되지 않았습니다. matplotlib_font_set()을 먼저 호출하세요."
+        )
+
+    pages = 0
+    with PdfPages(path, metadata=metadata) as pdf:
+        for builder in builders:
+            fig = Figure(figsize=figsize)
+            result = builder(fig)
+            if isinstance(result, Figure) and result is not fig:
+                fig = result
+            pdf.savefig(fig, **savefig_kwargs)
+            plt.close(fig)
+            fig = result = None
+            pages += 1
+            if gc_every and pages % gc_every == 0:
+                gc.collect()
+    logger.debug(f"PDF 리포트 저장 완료: {path} ({pages} 페이지)")
+    return pages
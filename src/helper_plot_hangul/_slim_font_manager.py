@@ -0,0 +1,253 @@
+"""한글 전용 경량 FontManager 모드.
+
+matplotlib 전역 fontManager 의 ttflist/afmlist 를 레지스트리 폰트, 선호 폰트,
+matplotlib 동봉 폰트, 지정한 대체(fallback) 폰트만 남기도록 제자리(in-place)에서 축소합니다.
+backend_agg, textpath 등이 임포트 시점에 fontManager 객체를 직접 참조하므로
+객체를 교체하지 않고 목록만 교체합니다.
+
+경량 모드에서는 단일 패밀리 이름(일반 별칭 제외)으로 폰트를 찾을 때 ttflist 전체 대신
+패밀리 맵의 해당 항목만 점수화하는 findfont 빠른 경로를 사용합니다.
+"""
+
+import functools
+import os
+from pathlib import Path
+
+from helper_plot_hangul._font_resource import matplotlib_font_resource
+from helper_plot_hangul._font_utils import get_preferred, hangul_font_paths
+from helper_plot_hangul._logger import logger
+
+_enabled: bool = False
+_fallback_families: tuple = ()
+# {family_name: [FontEntry, ...]} — 축소된 ttflist 의 패밀리별 항목
+_family_map: dict = {}
+# {소문자 패밀리 이름: [FontEntry, ...]} — findfont 빠른 경로용 (score_family 와 같은 대소문자 무시 비교)
+_family_index: dict = {}
+# 패밀리 맵을 만든 ttflist 객체와 길이 (이후 addfont 등으로 바뀌면 빠른 경로 생략)
+_indexed_list: tuple = (None, 0)
+# 전체 폰트 목록에도 없는 것으로 확인된 패밀리 이름 (전체 목록 재로드 반복 방지)
+_absent_families: set = set()
+
+
+def _mpl_data_dir() -> str:
+    """matplotlib 동봉 폰트 폴더 경로."""
+    import matplotlib as mpl
+
+    return str(Path(mpl.get_data_path(), "fonts").resolve())
+
+
+def _is_under(fname: str, directory: str) -> bool:
+    """fname 이 directory 하위 파일인지 확인."""
+    try:
+        return str(Path(fname).resolve()).startswith(directory + os.sep)
+    except OSError:
+        return False
+
+
+def _best_entry(mgr, prop, entries):
+    """같은 패밀리 항목 중 findfont 와 같은 점수 규칙으로 가장 잘 맞는 항목 반환."""
+    best_score = 1e64
+    best = None
+    for entry in entries:
+        score = (
+            mgr.score_style(prop.get_style(), entry.style)
+            + mgr.score_variant(prop.get_variant(), entry.variant)
+            + mgr.score_weight(prop.get_weight(), entry.weight)
+            + mgr.score_stretch(prop.get_stretch(), entry.stretch)
+            + mgr.score_size(prop.get_size(), entry.size)
+        )
+        if score < best_score:
+            best_score = score
+            best = entry
+        if score == 0:
+            break
+    return best
+
+
+def _make_findfont_cached(original):
+    """패밀리 맵으로 후보를 좁히는 FontManager._findfont_cached 생성."""
+    import matplotlib.font_manager as fm
+
+    font_path = getattr(fm, "FontPath", None)
+    realpath = getattr(fm, "_cached_realpath", os.path.realpath)
+    normalize_weight = fm._normalize_weight
+
+    @functools.lru_cache(1024)
+    def _findfont_cached(self, prop, fontext, directory, *args):
+        if _enabled and fontext == "ttf" and directory is None:
+            entries = None
+            props = fm.FontProperties._from_any(prop)
+            families = props.get_family()
+            if (
+                props.get_file() is None
+                and len(families) == 1
+                and families[0].lower() not in fm.font_family_aliases
+                and self.ttflist is _indexed_list[0]
+                and len(self.ttflist) == _indexed_list[1]
+            ):
+                entries = _family_index.get(families[0].lower())
+            best = _best_entry(self, props, entries) if entries else None
+            # 굵기가 다르면 경고 로그를 남기도록, 파일이 없으면 캐시 재구성을 하도록 원래 경로 사용
+            if (
+                best is not None
+                and normalize_weight(props.get_weight()) == normalize_weight(best.weight)
+                and os.path.isfile(best.fname)
+            ):
+                if font_path is None:
+                    return realpath(best.fname)
+                return font_path(realpath(best.fname), best.index)
+        return original(self, prop, fontext, directory, *args)
+
+    _findfont_cached._helper_plot_hangul_slim = True
+    return _findfont_cached
+
+
+def _install_findfont_fast_path() -> None:
+    """현재 로드된 FontManager 에 패밀리 맵 빠른 경로 패치 적용 (중복 적용 방지)."""
+    try:
+        from matplotlib.font_manager import FontManager
+
+        cached = FontManager._findfont_cached
+        if getattr(cached, "_helper_plot_hangul_slim", False):
+            return
+        FontManager._findfont_cached = _make_findfont_cached(cached.__wrapped__)
+        logger.debug("FontManager._findfont_cached 패밀리 맵 빠른 경로 패치 완료")
+    except Exception as e:
+        logger.debug(f"FontManager._findfont_cached 패치 실패 (무시): {e}")
+
+
+def apply_slim_font_manager() -> None:
+    """현재 로드된 fontManager 에 경량 모드 적용 (활성화 상태에서만).
+
+    matplotlib_font_reset() 이 matplotlib 모듈을 재로드한 뒤와 matplotlib_font_set() 으로
+    선호 폰트가 바뀐 뒤에도 호출됩니다.
+    """
+    global _family_map, _family_index, _indexed_list
+    if not _enabled:
+        return
+    import matplotlib.font_manager as fm
+
+    mgr = fm.fontManager
+    keep_paths = hangul_font_paths()
+    _, preferred_family, _ = get_preferred()
+    keep_names = set(_fallback_families)
+    # 선호 패밀리는 문자열 또는 rcParams['font.family'] 같은 목록일 수 있음
+    if isinstance(preferred_family, str):
+        keep_names.add(preferred_family)
+    elif preferred_family:
+        keep_names.update(preferred_family)
+    data_dir = _mpl_data_dir()
+
+    # 이미 축소된 목록에 없는 선호/대체 패밀리는 matplotlib 폰트 캐시(전체 목록)에서 다시 가져옴
+    source = mgr.ttflist
+    present_names = {entry.name for entry in source}
+    missing = {
+        name
+        for name in keep_names
+        if name not in present_names
+        and name not in _absent_families
+        and name.lower() not in fm.font_family_aliases
+    }
+    if missing:
+        full = fm._load_fontmanager(try_read_cache=True).ttflist
+        source = source + [entry for entry in full if entry.name in missing]
+        _absent_families.update(missing - {entry.name for entry in full})
+
+    ttflist = []
+    seen = set()
+    for entry in source:
+        if not (
+            entry.fname in keep_paths
+            or entry.name in keep_names
+            or _is_under(entry.fname, data_dir)
+        ):
+            continue
+        ident = (entry.fname, getattr(entry, "index", 0), entry.name, entry.style, entry.weight)
+        if ident in seen:
+            continue
+        seen.add(ident)
+        ttflist.append(entry)
+    before = len(mgr.ttflist)
+    mgr.ttflist = ttflist
+    mgr.afmlist = [entry for entry in mgr.afmlist if _is_under(entry.fname, data_dir)]
+
+    # 레지스트리 폰트가 아직 fontManager 에 없으면 추가 (addfont 가 findfont 캐시도 비움)
+    present = {entry.fname for entry in mgr.ttflist}
+    for family in matplotlib_font_resource.families():
+        path = matplotlib_font_resource.path_of(family)
+        if path and path not in present:
+            mgr.addfont(path)
+
+    family_map: dict[str, list] = {}
+    family_index: dict[str, list] = {}
+    for entry in mgr.ttflist:
+        family_map.setdefault(entry.name, []).append(entry)
+        family_index.setdefault(entry.name.lower(), []).append(entry)
+    _family_map = family_map
+    _family_index = family_index
+    _indexed_list = (mgr.ttflist, len(mgr.ttflist))
+
+    _install_findfont_fast_path()
+    if hasattr(mgr, "_findfont_cached"):
+        mgr._findfont_cached.cache_clear()
+    logger.debug(f"경량 fontManager 적용: ttflist {before} -> {len(mgr.ttflist)}")
+
+
+def enable_slim_font_manager(
+    fallback_families: tuple[str, ...] | list[str] = (),
+) -> dict[str, list]:
+    """fontManager 를 한글 레지스트리 폰트 중심의 경량 목록으로 축소.
+
+    Parameters
+    ----------
+    fallback_families : tuple[str, ...] | list[str]
+        레지스트리 폰트와 matplotlib 동봉 폰트 외에 유지할 시스템 폰트 패밀리 이름
+        (예: ('Noto Sans CJK KR',)). 선호 폰트 패밀리는 항상 유지됩니다.
+
+    Returns
+    -------
+    dict[str, list]
+        축소된 fontManager 의 {패밀리 이름: [FontEntry, ...]} 매핑
+
+    Examples
+    --------
+    >>> from helper_plot_hangul import enable_slim_font_manager
+    >>> family_map = enable_slim_font_manager(fallback_families=("Noto Sans CJK KR",))
+    >>> "NanumBarunGothic" in family_map
+    True
+    """
+    global _enabled, _fallback_families
+    _fallback_families = tuple(fallback_families)
+    _enabled = True
+    apply_slim_font_manager()
+    return dict(_family_map)
+
+
+def disable_slim_font_manager() -> None:
+    """경량 모드 해제: matplotlib 폰트 캐시(fontlist json)에서 전체 목록을 다시 읽어 복원."""
+    global _enabled, _family_map, _family_index, _indexed_list
+    if not _enabled:
+        return
+    import matplotlib.font_manager as fm
+
+    full = fm._load_fontmanager(try_read_cache=True)
+    fm.fontManager.ttflist = full.ttflist
+    fm.fontManager.afmlist = full.afmlist
+    _enabled = False
+    _family_map = {}
+    _family_index = {}
+    _indexed_list = (None, 0)
+    _absent_families.clear()
+    fm.fontManager._findfont_cached.cache_clear()
+    matplotlib_font_resource.load_all()
+    logger.debug(f"경량 fontManager 해제: ttflist {len(fm.fontManager.ttflist)}")
+
+
+def slim_font_family_map() -> dict[str, list]:
+    """경량 모드의 {패밀리 이름: [FontEntry, ...]} 매핑 반환 (비활성 상태면 빈 dict)."""
+    return dict(_family_map)
+
+
+def is_slim_font_manager_enabled() -> bool:
+    """경량 모드 활성화 여부."""
+    return _enabled
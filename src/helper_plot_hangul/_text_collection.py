@@ -0,0 +1,336 @@
+"""대량 한글 라벨용 일괄(batched) 텍스트 아티스트.
+
+수천~수만 개 라벨을 Text 아티스트 하나씩 만드는 대신, 선호 한글 폰트를 한 번만 찾고
+캐시된 글리프 진행폭으로 전체 배치를 NumPy 로 한 번에 계산한 뒤, 모든 글리프 아웃라인을
+하나의 Path 로 합쳐 백엔드 draw_path 한 번으로 그립니다.
+"""
+
+from typing import Any, Sequence
+
+import numpy as np
+
+from helper_plot_hangul._font_utils import preferred_font_file
+from helper_plot_hangul._glyph_metrics import font_glyphs, to_codepoints
+
+_HA_FACTOR = {"left": 0.0, "center": 0.5, "right": 1.0}
+_VA_CHOICES = ("baseline", "bottom", "center", "top")
+
+# (matplotlib.artist.Artist, 생성된 클래스) — matplotlib_font_reset() 이 비우고 이후 재생성
+_artist_cls_cache: tuple = (None, None)
+
+
+def _greedy_cull(boxes: np.ndarray) -> np.ndarray:
+    """앞선 라벨과 겹치는 라벨을 제거한 표시 여부 배열 반환 (격자 해시 기반 탐욕 알고리즘)."""
+    n = len(boxes)
+    visible = np.zeros(n, dtype=bool)
+    if not n:
+        return visible
+    sizes = boxes[:, 2:] - boxes[:, :2]
+    cell = max(float(np.median(sizes[:, 0])), float(np.median(sizes[:, 1])), 1.0)
+    cells = np.floor(boxes / cell).astype(np.int64)
+    grid: dict = {}
+    for i in range(n):
+        x0, y0, x1, y1 = boxes[i]
+        cx0, cy0, cx1, cy1 = cells[i]
+        keys = [(cx, cy) for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1)]
+        hit = False
+        for key in keys:
+            for j in grid.get(key, ()):
+                bx0, by0, bx1, by1 = boxes[j]
+                if x0 < bx1 and bx0 < x1 and y0 < by1 and by0 < y1:
+                    hit = True
+                    break
+            if hit:
+                break
+        if hit:
+            continue
+        visible[i] = True
+        for key in keys:
+            grid.setdefault(key, []).append(i)
+    return visible
+
+
+def _make_artist_class():
+    """현재 로드된 matplotlib 의 Artist 를 상속한 HangulTextCollection 클래스 생성."""
+    from matplotlib.artist import Artist
+    from matplotlib.path import Path
+    from matplotlib.transforms import Bbox, IdentityTransform
+
+    class HangulTextCollection(Artist):
+        """여러 한글 라벨을 한 번에 배치하고 그리는 아티스트.
+
+        Parameters
+        ----------
+        offsets : array-like, shape (N, 2)
+            라벨 기준점 좌표 (transform 좌표계)
+        texts : Sequence[str]
+            라벨 문자열
+        fontsize : float
+            글자 크기 (pt)
+        color : Any
+            글자 색
+        ha : str
+            가로 정렬 ('left', 'center', 'right')
+        va : str
+            세로 정렬 ('baseline', 'bottom', 'center', 'top')
+        cull_overlap : bool
+            True 이면 앞선 라벨과 겹치는 라벨을 그리지 않음
+        font_path : str | None
+            폰트 파일 경로. None 이면 선호 한글 폰트 사용
+        """
+
+        def __init__(
+            self,
+            offsets: Any,
+            texts: Sequence[str],
+            *,
+            fontsize: float,
+            color: Any = "black",
+            ha: str = "left",
+            va: str = "baseline",
+            cull_overlap: bool = False,
+            font_path: str | None = None,
+            **kwargs: Any,
+        ) -> None:
+            super().__init__()
+            if ha not in _HA_FACTOR:
+                raise ValueError(f"ha 는 {tuple(_HA_FACTOR)} 중 하나여야 합니다: {ha!r}")
+            if va not in _VA_CHOICES:
+                raise ValueError(f"va 는 {_VA_CHOICES} 중 하나여야 합니다: {va!r}")
+            offsets = np.asarray(offsets, dtype=np.float64).reshape(-1, 2)
+            texts = [str(t) for t in texts]
+            if len(offsets) != len(texts):
+                raise ValueError(f"offsets({len(offsets)})와 texts({len(texts)}) 길이가 다릅니다")
+
+            keep = np.fromiter((bool(t) for t in texts), dtype=bool, count=len(texts))
+            self._offsets = offsets[keep]
+            self._texts = [t for t in texts if t]
+            self._fontsize = float(fontsize)
+            self._color = color
+            self._ha = ha
+            self._va = va
+            self._cull_overlap = cull_overlap
+            self._glyphs = font_glyphs(font_path or preferred_font_file())
+            self._layout()
+            self.set(**kwargs)
+
+        def _layout(self) -> None:
+            """글자 크기와 무관한 em 단위 배치를 한 번에 계산."""
+            glyphs = self._glyphs
+            lengths = np.fromiter((len(t) for t in self._texts), dtype=np.int64)
+            cps = to_codepoints("".join(self._texts))
+            adv = glyphs.advances(cps) if len(cps) else np.zeros(0)
+            starts = np.cumsum(lengths) - lengths
+            csum = np.cumsum(adv) - adv
+            pen = csum - np.repeat(csum[starts] if len(starts) else csum, lengths)
+            self._widths = np.add.reduceat(adv, starts) if len(starts) else np.zeros(0)
+
+            # 고유 글리프 아웃라인을 이어붙인 뒤, 글리프 출현 순서대로 정점 인덱스를 생성
+            unique, inverse = np.unique(cps, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            outlines = [glyphs.outline(int(cp)) for cp in unique]
+            u_len = np.array([len(v) for v, _ in outlines], dtype=np.int64)
+            u_start = np.cumsum(u_len) - u_len
+            verts_u = np.concatenate([v for v, _ in outlines] or [np.zeros((0, 2))])
+            codes_u = np.concatenate([c for _, c in outlines] or [np.zeros(0, np.uint8)])
+
+            g_len = u_len[inverse]
+            total = int(g_len.sum())
+            g_first = np.cumsum(g_len) - g_len
+            vertex_glyph = np.repeat(np.arange(len(cps)), g_len)
+            idx = np.arange(total) - g_first[vertex_glyph] + u_start[inverse][vertex_glyph]
+            string_of_glyph = np.repeat(np.arange(len(self._texts)), lengths)
+
+            local = verts_u[idx].copy()
+            local[:, 0] += pen[vertex_glyph]
+            self._local = local
+            self._codes = codes_u[idx]
+            self._vertex_string = string_of_glyph[vertex_glyph]
+
+        def _display_boxes(self, renderer) -> tuple:
+            """라벨별 기준점 이동량과 표시 좌표 bbox 반환."""
+            size = self._fontsize * (
+                renderer.points_to_pixels(1.0) if renderer is not None else self.figure.dpi / 72
+            )
+            anchors = self.get_transform().transform(self._offsets)
+            widths = self._widths * size
+            ascent = self._glyphs.ascent * size
+            descent = self._glyphs.descent * size
+            dy = {
+                "baseline": 0.0,
+                "bottom": descent,
+                "center": (descent - ascent) / 2,
+                "top": -ascent,
+            }[self._va]
+            shift = np.column_stack([-widths * _HA_FACTOR[self._ha], np.full(len(widths), dy)])
+            origin = anchors + shift
+            boxes = np.column_stack(
+                [
+                    origin[:, 0],
+                    origin[:, 1] - descent,
+                    origin[:, 0] + widths,
+                    origin[:, 1] + ascent,
+                ]
+            )
+            return size, origin, boxes
+
+        def draw(self, renderer) -> None:
+            if not self.get_visible() or not self._texts:
+                return
+            size, origin, boxes = self._display_boxes(renderer)
+            vertices = self._local * size + origin[self._vertex_string]
+            codes = self._codes
+            if self._cull_overlap:
+                mask = _greedy_cull(boxes)[self._vertex_string]
+                vertices = vertices[mask]
+                codes = codes[mask]
+            if not len(vertices):
+                return
+
+            renderer.open_group("hangul_text_collection", gid=self.get_gid())
+            gc = renderer.new_gc()
+            self._set_gc_clip(gc)
+            gc.set_alpha(self.get_alpha())
+            gc.set_linewidth(0)
+            gc.set_antialiased(True)
+            gc.set_url(self.get_url())
+            from matplotlib.colors import to_rgba
+
+            renderer.draw_path(
+                gc,
+                Path(vertices, codes),
+                IdentityTransform(),
+                to_rgba(self._color, self.get_alpha()),
+            )
+            gc.restore()
+            renderer.close_group("hangul_text_collection")
+            self.stale = False
+
+        def get_window_extent(self, renderer=None) -> Bbox:
+            if not self._texts:
+                return Bbox.null()
+            _, _, boxes = self._display_boxes(renderer)
+            if self._cull_overlap:
+                boxes = boxes[_greedy_cull(boxes)]
+            return Bbox([boxes[:, :2].min(axis=0), boxes[:, 2:].max(axis=0)])
+
+        def get_texts(self) -> list[str]:
+            """(빈 문자열을 제외한) 라벨 문자열 목록 반환."""
+            return list(self._texts)
+
+    return HangulTextCollection
+
+
+def _artist_class():
+    """현재 matplotlib 기준 HangulTextCollection 클래스 반환 (리셋 후 자동 재생성)."""
+    global _artist_cls_cache
+    from matplotlib.artist import Artist
+
+    base, cls = _artist_cls_cache
+    if base is not Artist:
+        cls = _make_artist_class()
+        _artist_cls_cache = (Artist, cls)
+    return cls
+
+
+def clear_artist_class() -> None:
+    """생성된 클래스 해제 (이전 matplotlib 모듈 그래프가 남지 않도록 리셋 시 호출)."""
+    global _artist_cls_cache
+    _artist_cls_cache = (None, None)
+
+
+def hangul_text_collection(
+    ax: Any,
+    x: Any,
+    y: Any,
+    texts: Sequence[str],
+    *,
+    fontsize: float | None = None,
+    color: Any = None,
+    ha: str = "left",
+    va: str = "baseline",
+    cull_overlap: bool = False,
+    font_path: str | None = None,
+    **kwargs: Any,
+) -> Any:
+    """여러 한글 라벨을 일괄 텍스트 아티스트 하나로 Axes 에 추가.
+
+    ax.text() 를 반복 호출하는 대신 사용합니다. 폰트 탐색은 한 번만 수행하고,
+    배치는 캐시된 글리프 진행폭으로 한 번에 계산하며, 그리기는 백엔드 호출 한 번으로 끝납니다.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        라벨을 추가할 Axes
+    x, y : array-like
+        라벨 기준점 데이터 좌표 (ax.text() 와 같이 범주형/날짜 등 단위 데이터 허용)
+    texts : Sequence[str]
+        라벨 문자열 (x, y 와 같은 길이)
+    fontsize : float, optional
+        글자 크기 (pt). 기본값: rcParams['font.size']
+    color : Any, optional
+        글자 색 (전체 공통). 기본값: rcParams['text.color']
+    ha : str
+        가로 정렬 ('left', 'center', 'right')
+    va : str
+        세로 정렬 ('baseline', 'bottom', 'center', 'top')
+    cull_overlap : bool
+        True 이면 앞선 라벨과 겹치는 라벨을 그리지 않음 (앞쪽 라벨 우선)
+    font_path : str, optional
+        폰트 파일 경로. 기본값: 선호 한글 폰트 (get_preferred())
+    **kwargs
+        Artist 속성 (alpha, zorder, clip_on 등)
+
+    Returns
+    -------
+    HangulTextCollection
+        추가된 아티스트
+
+    Notes
+    -----
+    글리프는 커닝 없이 진행폭만으로 배치하며, 폰트에 없는 문자는 대체 폰트 대신
+    .notdef 글리프로 그려집니다. 회전과 여러 줄 텍스트는 지원하지 않습니다.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import matplotlib.pyplot as plt
+    >>> from helper_plot_hangul import hangul_text_collection
+    >>> fig, ax = plt.subplots()
+    >>> x, y = np.random.rand(2, 20000)
+    >>> ax.scatter(x, y, s=1)
+    >>> labels = [f"지점{i}" for i in range(20000)]
+    >>> hangul_text_collection(ax, x, y, labels, fontsize=6, cull_overlap=True)
+    """
+    import matplotlib as mpl
+
+    # 범주형/날짜 축 등 단위 변환 (ax.scatter 와 같이 축 단위 등록 후 변환)
+    ax.xaxis.update_units(x)
+    ax.yaxis.update_units(y)
+    offsets = np.column_stack(
+        [
+            np.asarray(ax.convert_xunits(x), dtype=np.float64),
+            np.asarray(ax.convert_yunits(y), dtype=np.float64),
+        ]
+    )
+    kwargs.setdefault("zorder", 3)
+    # ax.text() 와 동일하게 기본적으로 Axes 영역 밖도 그림 (clip_on=True 로 잘라내기)
+    kwargs.setdefault("clip_on", False)
+    artist = _artist_class()(
+        offsets,
+        texts,
+        fontsize=mpl.rcParams["font.size"] if fontsize is None else fontsize,
+        color=mpl.rcParams["text.color"] if color is None else color,
+        ha=ha,
+        va=va,
+        cull_overlap=cull_overlap,
+        font_path=font_path,
+        transform=ax.transData,
+        **kwargs,
+    )
+    artist.set_clip_path(ax.patch)
+    ax.add_artist(artist)
+    if len(offsets):
+        ax.update_datalim(offsets)
+        ax.autoscale_view()
+    return artist
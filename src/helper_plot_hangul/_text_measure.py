@@ -0,0 +1,216 @@
+"""렌더러 없이 한글 문자열 폭을 추정하는 벡터화 측정/줄바꿈/말줄임 함수.
+
+Figure 를 그린 뒤 get_window_extent 를 호출하는 대신, 폰트별 진행폭(advance) 테이블을
+코드포인트로 인덱싱하여 문자열 배열 전체의 폭을 NumPy 로 한 번에 계산합니다.
+"""
+
+from typing import Iterable
+
+import numpy as np
+
+from helper_plot_hangul._font_utils import preferred_font_file
+from helper_plot_hangul._glyph_metrics import font_glyphs, to_codepoints
+
+
+def _scale(fontsize, dpi: float) -> float:
+    """em 단위 → 픽셀 변환 배율 (fontsize 는 포인트 또는 'large' 등 rcParams 크기 이름)."""
+    from matplotlib.font_manager import FontProperties
+
+    return FontProperties(size=fontsize).get_size_in_points() * dpi / 72.0
+
+
+def _cumulative(texts: list, font_path: str | None) -> tuple[np.ndarray, np.ndarray]:
+    """이어 붙인 전체 문자열의 누적 진행폭(em)과 각 문자열 시작 오프셋 반환.
+
+    누적 배열 csum 에 대해 문자열 i 의 [a, b) 구간 폭은 csum[starts[i] + b] - csum[starts[i] + a].
+    """
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    starts = np.zeros(len(texts), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    cps = to_codepoints("".join(texts))
+    csum = np.zeros(len(cps) + 1)
+    if len(cps):
+        np.cumsum(font_glyphs(font_path or preferred_font_file()).advances(cps), out=csum[1:])
+    return csum, starts
+
+
+def _split_lines(texts: Iterable) -> tuple[list, np.ndarray]:
+    """문자열들을 줄 단위로 펼친 목록과 문자열별 줄 수 반환."""
+    lines: list = []
+    counts = []
+    for text in texts:
+        parts = str(text).split("\n")
+        lines.extend(parts)
+        counts.append(len(parts))
+    return lines, np.asarray(counts, dtype=np.int64)
+
+
+def measure_text_width(
+    texts: Iterable[str],
+    fontsize: float | str | None = None,
+    dpi: float = 72,
+    font_path: str | None = None,
+) -> np.ndarray:
+    """문자열 배열의 렌더링 폭을 렌더러 없이 추정.
+
+    Parameters
+    ----------
+    texts : Iterable[str]
+        측정할 문자열들 (여러 줄 문자열은 가장 긴 줄의 폭)
+    fontsize : float | str | None
+        글자 크기 (포인트 또는 'large' 등). None 이면 rcParams['font.size']
+    dpi : float
+        픽셀 변환 기준 dpi (기본값: 72, 즉 결과가 포인트 단위)
+    font_path : str | None
+        폰트 파일 경로. None 이면 선호 한글 폰트 (get_preferred() 우선)
+
+    Returns
+    -------
+    np.ndarray
+        문자열별 폭 (픽셀, float64)
+
+    Notes
+    -----
+    힌팅 없는 글리프 진행폭의 합이며 커닝은 반영하지 않습니다. 양 끝 글자의 좌우 여백
+    (side bearing)이 포함되므로 get_window_extent 의 잉크 폭보다 2~3% 정도 넓게 추정되어,
+    줄바꿈/말줄임 판단에서는 넘치지 않는 쪽으로 보수적입니다.
+    폰트에 없는 문자는 .notdef 폭으로 계산됩니다.
+
+    Examples
+    --------
+    >>> from helper_plot_hangul import measure_text_width
+    >>> measure_text_width(["서울특별시", "부산광역시 해운대구"], fontsize=10, dpi=100)
+    array([ 61.94438785, 114.61100624])
+    """
+    lines, counts = _split_lines(texts)
+    if not lines:
+        return np.zeros(0)
+    csum, starts = _cumulative(lines, font_path)
+    lengths = np.fromiter(map(len, lines), dtype=np.int64, count=len(lines))
+    line_widths = csum[starts + lengths] - csum[starts]
+    # 여러 줄 문자열은 줄 폭의 최댓값 (줄 수는 항상 1 이상이므로 reduceat 구간이 비지 않음)
+    offsets = np.zeros(len(counts), dtype=np.int64)
+    np.cumsum(counts[:-1], out=offsets[1:])
+    return np.maximum.reduceat(line_widths, offsets) * _scale(fontsize, dpi)
+
+
+def truncate_texts(
+    texts: Iterable[str],
+    max_width: float,
+    fontsize: float | str | None = None,
+    dpi: float = 72,
+    font_path: str | None = None,
+    ellipsis: str = "…",
+) -> list[str]:
+    """폭이 max_width 를 넘는 문자열을 잘라 말줄임표를 붙임 (렌더러 없이 계산).
+
+    Parameters
+    ----------
+    texts : Iterable[str]
+        대상 문자열들 (한 줄 문자열 기준)
+    max_width : float
+        최대 폭 (픽셀, dpi 기준)
+    fontsize, dpi, font_path
+        measure_text_width 와 동일
+    ellipsis : str
+        잘린 문자열 끝에 붙일 문자열 (기본값: '…')
+
+    Returns
+    -------
+    list[str]
+        말줄임이 적용된 문자열 목록 (폭 이내인 문자열은 그대로)
+
+    Examples
+    --------
+    >>> from helper_plot_hangul import truncate_texts
+    >>> truncate_texts(["서울특별시 강남구 역삼동", "부산"], max_width=80, fontsize=10)
+    ['서울특별시 강남…', '부산']
+    """
+    texts = [str(t) for t in texts]
+    if not texts:
+        return []
+    scale = _scale(fontsize, dpi)
+    csum, starts = _cumulative(texts + [ellipsis], font_path)
+    ellipsis_width = csum[-1] - csum[starts[-1]]
+    csum, starts = csum[: starts[-1] + 1], starts[:-1]
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+
+    limit = max_width / scale
+    over = csum[starts + lengths] - csum[starts] > limit
+    # 말줄임표를 포함해 limit 안에 들어가는 가장 긴 접두어 길이 (누적 폭 searchsorted)
+    keep = np.searchsorted(csum, csum[starts] + limit - ellipsis_width, side="right") - 1 - starts
+    keep = np.clip(keep, 0, lengths)
+
+    result = []
+    for text, cut, k in zip(texts, over, keep):
+        result.append(text[:k].rstrip() + ellipsis if cut else text)
+    return result
+
+
+def wrap_texts(
+    texts: Iterable[str],
+    max_width: float,
+    fontsize: float | str | None = None,
+    dpi: float = 72,
+    font_path: str | None = None,
+) -> list[str]:
+    """문자열을 max_width 폭에 맞춰 줄바꿈 (렌더러 없이 계산).
+
+    공백(어절 경계)에서 우선 줄을 나누고, 한 어절이 max_width 보다 길면 글자 단위로 나눕니다.
+    기존 줄바꿈('\\n')은 유지됩니다.
+
+    Parameters
+    ----------
+    texts : Iterable[str]
+        대상 문자열들
+    max_width : float
+        줄 최대 폭 (픽셀, dpi 기준)
+    fontsize, dpi, font_path
+        measure_text_width 와 동일
+
+    Returns
+    -------
+    list[str]
+        줄바꿈('\\n')이 삽입된 문자열 목록
+
+    Examples
+    --------
+    >>> from helper_plot_hangul import wrap_texts
+    >>> wrap_texts(["서울특별시 강남구 역삼동"], max_width=60, fontsize=10)
+    ['서울특별시\\n강남구 역삼동']
+    """
+    lines, counts = _split_lines(texts)
+    if not lines:
+        return []
+    limit = max_width / _scale(fontsize, dpi)
+    csum, starts = _cumulative(lines, font_path)
+
+    wrapped = []
+    for line, start in zip(lines, starts):
+        n = len(line)
+        if csum[start + n] - csum[start] <= limit:
+            wrapped.append(line)
+            continue
+        pieces = []
+        pos = 0
+        while pos < n:
+            # pos 부터 limit 안에 들어가는 마지막 위치 (최소 한 글자는 진행)
+            end = int(np.searchsorted(csum, csum[start + pos] + limit, side="right")) - 1 - start
+            end = min(max(end, pos + 1), n)
+            if end < n:
+                # 줄 끝 공백은 폭을 넘어도 허용하므로 end 위치 글자까지 포함해 공백 탐색
+                space = line.rfind(" ", pos + 1, end + 1)
+                if space > pos:
+                    end = space
+            pieces.append(line[pos:end].rstrip())
+            pos = end
+            while pos < n and line[pos] == " ":
+                pos += 1
+        wrapped.append("\n".join(pieces))
+
+    result = []
+    index = 0
+    for count in counts:
+        result.append("\n".join(wrapped[index : index + count]))
+        index += count
+    return result
@@ -0,0 +1,151 @@
+"""벡터 출력(svg.fonttype='path' 등)용 한글 텍스트 아웃라인 캐시.
+
+TextToPath.get_glyphs_with_font 결과(글리프 배치 + 글리프 아웃라인)를 문자열 단위로
+프로세스 전역 LRU 캐시에 보관하여, 같은 한글 문자열을 다시 저장할 때 FreeType 레이아웃과
+아웃라인 추출을 생략합니다. enable_textpath_cache() 로 명시적으로 켭니다.
+"""
+
+from collections import OrderedDict
+
+from helper_plot_hangul._font_utils import hangul_font_paths
+from helper_plot_hangul._logger import logger
+from helper_plot_hangul._lru import ByteBoundedLRU
+
+_DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+_enabled: bool = False
+_all_fonts: bool = False
+
+
+def _sizeof(entry: tuple) -> int:
+    """캐시 항목의 아웃라인 배열 바이트 합계."""
+    _, outlines, _ = entry
+    return sum(
+        getattr(verts, "nbytes", 0) + getattr(codes, "nbytes", 0)
+        for verts, codes in outlines.values()
+    )
+
+
+# {(font_file, text, font_scale): (glyph_info, outlines, rects)}
+_cache = ByteBoundedLRU(_DEFAULT_MAX_BYTES, sizeof=_sizeof)
+
+
+def _make_cached_get_glyphs_with_font(orig_get_glyphs_with_font):
+    """TextToPath.get_glyphs_with_font 를 감싸는 캐시 적용 함수 생성."""
+
+    def get_glyphs_with_font(self, font, s, glyph_map=None, return_new_glyphs_only=False, **kwargs):
+        fname = getattr(font, "fname", None)
+        if (
+            not _enabled
+            or not s
+            or fname is None
+            or any(v is not None for v in kwargs.values())
+            or (not _all_fonts and fname not in hangul_font_paths())
+        ):
+            return orig_get_glyphs_with_font(
+                self, font, s, glyph_map, return_new_glyphs_only, **kwargs
+            )
+
+        key = (fname, s, self.FONT_SCALE)
+        entry = _cache.get(key)
+        if entry is None:
+            # 대체(fallback) 폰트가 관여하는 문자열은 폰트 조합마다 결과가 달라지므로 캐시하지 않음
+            if any(font.get_char_index(ord(c)) == 0 for c in set(s)):
+                return orig_get_glyphs_with_font(
+                    self, font, s, glyph_map, return_new_glyphs_only, **kwargs
+                )
+            glyph_info, outlines, rects = orig_get_glyphs_with_font(self, font, s, **kwargs)
+            entry = (tuple(glyph_info), outlines, tuple(rects))
+            _cache.put(key, entry)
+
+        glyph_info, outlines, rects = entry
+        if glyph_map is None:
+            glyph_map = OrderedDict()
+        glyph_map_new = OrderedDict() if return_new_glyphs_only else glyph_map
+        for glyph_repr, outline in outlines.items():
+            if glyph_repr not in glyph_map:
+                glyph_map_new[glyph_repr] = outline
+        return list(glyph_info), glyph_map_new, list(rects)
+
+    get_glyphs_with_font._helper_plot_hangul_cached = True
+    get_glyphs_with_font.__wrapped__ = orig_get_glyphs_with_font
+    return get_glyphs_with_font
+
+
+def install_textpath_cache() -> None:
+    """현재 로드된 TextToPath 에 캐시 패치 적용 (활성화 상태에서만, 중복 적용 방지).
+
+    matplotlib_font_reset() 이 matplotlib 모듈을 재로드한 뒤에도 호출됩니다.
+    """
+    if not _enabled:
+        return
+    try:
+        from matplotlib.textpath import TextToPath
+
+        if getattr(TextToPath.get_glyphs_with_font, "_helper_plot_hangul_cached", False):
+            return
+        TextToPath.get_glyphs_with_font = _make_cached_get_glyphs_with_font(
+            TextToPath.get_glyphs_with_font
+        )
+        logger.debug("TextToPath.get_glyphs_with_font 아웃라인 캐시 패치 완료")
+    except Exception as e:
+        logger.debug(f"TextToPath.get_glyphs_with_font 패치 실패 (무시): {e}")
+
+
+def enable_textpath_cache(max_bytes: int = _DEFAULT_MAX_BYTES, all_fonts: bool = False) -> None:
+    """한글 텍스트 아웃라인(TextPath) 캐시 활성화.
+
+    svg.fonttype='path' 저장, TextPath 생성 등 텍스트를 패스로 변환하는 모든 경로에 적용됩니다.
+
+    Parameters
+    ----------
+    max_bytes : int
+        캐시에 보관할 아웃라인 배열 총 바이트 상한 (초과 시 LRU 제거, 기본값: 32MB)
+    all_fonts : bool
+        True 이면 레지스트리/선호 폰트 외의 모든 폰트에도 캐시 적용
+
+    Notes
+    -----
+    캐시 키는 (폰트 파일, 문자열, TextToPath.FONT_SCALE) 입니다. 아웃라인은 FONT_SCALE 기준
+    크기로 추출된 뒤 출력 시 글자 크기에 맞게 변환되므로 글자 크기와 무관하게 재사용됩니다.
+    기본 폰트에 없는 문자가 포함된 문자열과 폰트 feature/language 지정 텍스트는 캐시하지 않습니다.
+
+    Examples
+    --------
+    >>> import matplotlib.pyplot as plt
+    >>> from helper_plot_hangul import enable_textpath_cache
+    >>> enable_textpath_cache()
+    >>> plt.rcParams["svg.fonttype"] = "path"
+    """
+    global _enabled, _all_fonts
+    _cache.resize(max_bytes)
+    _all_fonts = all_fonts
+    _enabled = True
+    install_textpath_cache()
+
+
+def disable_textpath_cache() -> None:
+    """아웃라인 캐시 비활성화 및 보관 중인 아웃라인 해제."""
+    global _enabled
+    _enabled = False
+    clear_textpath_cache()
+
+
+def clear_textpath_cache() -> None:
+    """보관 중인 아웃라인과 통계 초기화."""
+    _cache.clear()
+
+
+def textpath_cache_info() -> dict:
+    """캐시 상태 반환.
+
+    Returns
+    -------
+    dict
+        - 'enabled': 활성화 여부
+        - 'entries': 보관 중인 문자열 수
+        - 'bytes': 보관 중인 아웃라인 배열 총 바이트
+        - 'max_bytes': 바이트 상한
+        - 'hits' / 'misses': 조회 적중/실패 횟수
+    """
+    return {"enabled": _enabled, **_cache.info()}
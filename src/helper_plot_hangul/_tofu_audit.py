@@ -0,0 +1,191 @@
+"""savefig 직전 누락 글리프(tofu, 두부 문자) 검사.
+
+Figure 의 모든 Text 아티스트 문자열을 폰트별로 모아, 캐시된 cmap 코드포인트 배열과
+NumPy 로 한 번에 대조합니다. Figure.savefig 를 패치하는 방식이며
+enable_tofu_audit() 로 명시적으로 켭니다.
+"""
+
+import numpy as np
+
+from helper_plot_hangul._font_resource import matplotlib_font_resource
+from helper_plot_hangul._font_utils import _font_name_of, font_paths_for
+from helper_plot_hangul._glyph_metrics import to_codepoints
+from helper_plot_hangul._logger import logger
+
+_ACTIONS = ("warn", "raise", "fallback")
+
+_enabled: bool = False
+_action: str = "warn"
+# {font_path: 정렬된 cmap 코드포인트 배열 (uint32)}
+_cmap_cache: dict = {}
+
+
+class MissingGlyphError(ValueError):
+    """저장하려는 Figure 에 폰트가 지원하지 않는 문자가 있을 때 발생."""
+
+
+def _codepoints_of(path: str) -> np.ndarray:
+    """폰트 파일의 cmap 코드포인트 배열 반환 (캐시 우선)."""
+    codes = _cmap_cache.get(path)
+    if codes is None:
+        from matplotlib.ft2font import FT2Font
+
+        codes = np.fromiter(FT2Font(path).get_charmap().keys(), dtype=np.uint32)
+        codes.sort()
+        _cmap_cache[path] = codes
+    return codes
+
+
+def _covered(codes: np.ndarray, cmap: np.ndarray) -> np.ndarray:
+    """codes 각 원소가 정렬된 cmap 에 포함되는지 여부 (searchsorted 기반)."""
+    if not len(cmap):
+        return np.zeros(len(codes), dtype=bool)
+    idx = np.searchsorted(cmap, codes)
+    idx[idx == len(cmap)] = 0
+    return cmap[idx] == codes
+
+
+def _iter_plain_texts(fig):
+    """검사 대상 Text 아티스트와 문자열 (보이지 않거나 수식/TeX 텍스트 제외)."""
+    from matplotlib.text import Text
+
+    for text in fig.findobj(Text):
+        s = text.get_text()
+        if not s or not text.get_visible() or text.get_usetex():
+            continue
+        preprocess = getattr(text, "_preprocess_math", None)
+        if preprocess is not None and preprocess(s)[1]:
+            continue
+        yield text, s
+
+
+def audit_figure_glyphs(fig) -> dict:
+    """Figure 의 Text 아티스트 중 폰트가 지원하지 않는 문자가 있는 항목 반환.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        검사할 Figure
+
+    Returns
+    -------
+    dict
+        {Text 아티스트: 누락 문자 문자열} 매핑 (누락이 없으면 빈 dict)
+    """
+    # 폰트 조합별로 문자열을 모아 한 번에 대조
+    groups: dict = {}
+    for text, s in _iter_plain_texts(fig):
+        paths = font_paths_for(text.get_fontproperties())
+        groups.setdefault(paths, []).append((text, s))
+
+    missing: dict = {}
+    for paths, items in groups.items():
+        joined = "".join(s for _, s in items)
+        codes = to_codepoints(joined)
+        ok = codes < 0x20  # 제어 문자(줄바꿈 등)는 검사 제외
+        for path in paths:
+            ok |= _covered(codes, _codepoints_of(path))
+        if ok.all():
+            continue
+        offset = 0
+        for text, s in items:
+            bad = ~ok[offset : offset + len(s)]
+            if bad.any():
+                missing[text] = "".join(dict.fromkeys(np.array(list(s))[bad]))
+            offset += len(s)
+    return missing
+
+
+def _covering_font(chars: str) -> str | None:
+    """누락 문자 chars 를 모두 지원하는 레지스트리 폰트 파일 경로 반환."""
+    codes = to_codepoints(chars)
+    for family in matplotlib_font_resource.families():
+        path = matplotlib_font_resource.path_of(family)
+        if path and _covered(codes, _codepoints_of(path)).all():
+            return path
+    return None
+
+
+def _handle_missing(missing: dict) -> None:
+    """설정된 action 에 따라 누락 글리프 처리."""
+    if _action == "fallback":
+        unresolved = {}
+        for text, chars in missing.items():
+            path = _covering_font(chars)
+            if path is None:
+                unresolved[text] = chars
+                continue
+            # 레지스트리 키(파일명)가 아닌 폰트 내부 패밀리 이름으로 지정, 기존 패밀리는 대체 후보로 유지
+            family = _font_name_of(path)
+            text.set_fontfamily([family, *text.get_fontfamily()])
+            logger.debug(f"누락 글리프 대체 폰트 적용: {text.get_text()!r} -> {family}")
+        missing = unresolved
+        if not missing:
+            return
+
+    detail = ", ".join(f"{text.get_text()!r}: {chars!r}" for text, chars in missing.items())
+    message = f"폰트가 지원하지 않는 문자가 있습니다 ({len(missing)}개 텍스트): {detail}"
+    if _action == "raise":
+        raise MissingGlyphError(message)
+    logger.warning(message)
+
+
+def install_tofu_audit() -> None:
+    """현재 로드된 Figure.savefig 에 검사 패치 적용 (활성화 상태에서만, 중복 적용 방지).
+
+    matplotlib_font_reset()/matplotlib_font_set() 에서 style.use 패치와 함께 호출됩니다.
+    """
+    if not _enabled:
+        return
+    try:
+        from matplotlib.figure import Figure
+
+        if getattr(Figure.savefig, "_helper_plot_hangul_audit", False):
+            return
+        _orig_savefig = Figure.savefig
+
+        def savefig(self, *args, **kwargs):
+            if _enabled:
+                missing = audit_figure_glyphs(self)
+                if missing:
+                    _handle_missing(missing)
+            return _orig_savefig(self, *args, **kwargs)
+
+        savefig._helper_plot_hangul_audit = True
+        savefig.__wrapped__ = _orig_savefig
+        savefig.__doc__ = _orig_savefig.__doc__
+        Figure.savefig = savefig
+        logger.debug("Figure.savefig 누락 글리프 검사 패치 완료")
+    except Exception as e:
+        logger.debug(f"Figure.savefig 패치 실패 (무시): {e}")
+
+
+def enable_tofu_audit(action: str = "warn") -> None:
+    """savefig 직전 누락 글리프 검사 활성화.
+
+    Parameters
+    ----------
+    action : str
+        누락 글리프 발견 시 동작
+        - 'warn': 경고 로그 출력 후 저장 (기본값)
+        - 'raise': MissingGlyphError 발생 (저장하지 않음)
+        - 'fallback': 누락 문자를 모두 지원하는 레지스트리 폰트를 텍스트의 첫 번째 패밀리로
+          지정한 뒤 저장, 해당 폰트가 없으면 경고
+
+    Examples
+    --------
+    >>> from helper_plot_hangul import enable_tofu_audit
+    >>> enable_tofu_audit(action="raise")
+    """
+    global _enabled, _action
+    if action not in _ACTIONS:
+        raise ValueError(f"action 은 {_ACTIONS} 중 하나여야 합니다: {action!r}")
+    _action = action
+    _enabled = True
+    install_tofu_audit()
+
+
+def disable_tofu_audit() -> None:
+    """누락 글리프 검사 비활성화."""
+    global _enabled
+    _enabled = False
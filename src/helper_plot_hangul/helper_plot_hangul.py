@@ -1,20 +1,40 @@
 """공개 API: matplotlib 한글 폰트 설정 함수."""
 
+import atexit
+import functools
+import gc
 import inspect
+import io
 import os
 import sys
+import threading
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
-from helper_plot_hangul._env import is_jupyter_environment, is_streamlit_environment
-from helper_plot_hangul._font_resource import matplotlib_font_resource
+from helper_plot_hangul._env import (
+    is_jupyter_environment,
+    is_streamlit_environment,
+    is_streamlit_server_running,
+)
+from helper_plot_hangul._font_resource import addfont_once, matplotlib_font_resource
 from helper_plot_hangul._font_utils import (
     get_preferred,
     patch_style_use,
     reapply_font_rcparams,
     set_preferred,
 )
+from helper_plot_hangul._glyph_cache import install_glyph_cache
 from helper_plot_hangul._logger import logger
+from helper_plot_hangul._render_pool import acquire, clear_render_pool, release
+from helper_plot_hangul._slim_font_manager import (
+    apply_slim_font_manager,
+    is_slim_font_manager_enabled,
+)
+from helper_plot_hangul._text_collection import clear_artist_class
+from helper_plot_hangul._textpath_cache import install_textpath_cache
+from helper_plot_hangul._tofu_audit import install_tofu_audit
 
 try:
     import IPython
@@ -23,6 +43,131 @@ try:
 except ImportError:
     IPYTHON_AVAILABLE = False
 
+# Streamlit 프로세스 1회 초기화 상태 — 스크립트 재실행(rerun) 간 공유
+_streamlit_lock = threading.Lock()
+# {(font_family, font_path): (해석된 font_family, 해석된 font_path)}
+_streamlit_resolved: dict = {}
+# {fork 시점: [(소유 객체 약한 참조, 메서드 이름), ...]} — _weak_fork_hooks 참고
+_fork_callbacks: dict = {}
+
+
+def _purge_matplotlib_modules() -> None:
+    """sys.modules 에서 matplotlib(및 mpl_toolkits) 모듈을 제거하고 전역 참조 정리.
+
+    이전 모듈 객체는 그대로 두므로 리셋 전에 임포트한 참조(import matplotlib as mpl 등)도
+    계속 동작하며, 더 이상 참조되지 않으면 gc 로 해제됩니다.
+    """
+    clear_render_pool()
+    clear_artist_class()
+
+    helpers = sys.modules.get("matplotlib._pylab_helpers")
+    if helpers is not None:
+        helpers.Gcf.destroy_all()
+        atexit.unregister(helpers.Gcf.destroy_all)
+
+    old_fm = sys.modules.get("matplotlib.font_manager")
+    if old_fm is not None:
+        for name in ("_get_font", "get_font"):
+            cache_clear = getattr(getattr(old_fm, name, None), "cache_clear", None)
+            if cache_clear is not None:
+                cache_clear()
+
+    modules_to_remove = [
+        mod for mod in sys.modules if mod.startswith(("matplotlib", "mpl_toolkits"))
+    ]
+    for mod in modules_to_remove:
+        sys.modules.pop(mod)
+    gc.collect()
+
+
+def _run_fork_callbacks(when: str) -> None:
+    """재임포트된 matplotlib 가 등록한 fork 콜백 중 소유 객체가 살아 있는 것만 실행."""
+    for ref, name in _fork_callbacks.get(when, ()):
+        target = ref()
+        if target is not None:
+            getattr(target, name)()
+
+
+@contextmanager
+def _weak_fork_hooks():
+    """matplotlib 재임포트 동안 os.register_at_fork 콜백을 약한 참조로 등록.
+
+    font_manager 는 임포트 시 os.register_at_fork(after_in_child=_get_font.cache_clear) 를
+    등록하는데, fork 훅은 해제할 수 없어 그대로 두면 리셋할 때마다 이전 모듈 그래프 전체가 남습니다.
+    실제 fork 훅은 시점(before/after_in_child 등)별로 한 번만 등록합니다.
+    """
+    register = getattr(os, "register_at_fork", None)
+    if register is None:
+        yield
+        return
+
+    def weak_register(**callbacks):
+        for when, callback in callbacks.items():
+            try:
+                ref = weakref.ref(callback.__self__)
+            except (AttributeError, TypeError):
+                register(**{when: callback})
+                continue
+            entries = _fork_callbacks.get(when)
+            if entries is None:
+                entries = _fork_callbacks[when] = []
+                register(**{when: functools.partial(_run_fork_callbacks, when)})
+            entries[:] = [entry for entry in entries if entry[0]() is not None]
+            entries.append((ref, callback.__name__))
+
+    os.register_at_fork = weak_register
+    try:
+        yield
+    finally:
+        os.register_at_fork = register
+
+
+def _resolve_default_font(
+    font_family: str | None, font_path: str | None
+) -> tuple[str | None, str | None]:
+    """폰트가 지정되지 않았으면 기본 한글 폰트 (font_family, font_path) 결정.
+
+    레지스트리의 NanumGothic 을 우선 사용하고, 없으면 시스템 폰트(Windows 는 Malgun Gothic)를 씁니다.
+    """
+    if font_path is not None or font_family is not None:
+        return font_family, font_path
+
+    font_family = "NanumGothic"
+    font_path = matplotlib_font_resource.path_of("NanumGothic")
+    if font_path is None or not Path(font_path).exists():
+        font_path = None
+        if sys.platform.startswith("win"):
+            font_family = "Malgun Gothic"
+        logger.debug(f"레지스트리 폰트 없음, 시스템 폰트 사용: {font_family}")
+    else:
+        logger.debug(f"레지스트리 폰트 경로: {font_path}")
+    return font_family, font_path
+
+
+def _streamlit_font_set(
+    font_family: str | None, font_path: str | None, font_kwargs: dict, session: bool = True
+) -> str | None:
+    """Streamlit 스크립트 재실행용 matplotlib_font_set.
+
+    기본 폰트 탐색과 style.use/savefig 패치는 프로세스당 인자 조합별로 한 번만 수행하고,
+    재실행 때는 세션 선호 폰트 저장과 rcParams 재적용만 합니다.
+    """
+    key = (font_family, font_path)
+    resolved = _streamlit_resolved.get(key)
+    if resolved is None:
+        with _streamlit_lock:
+            resolved = _streamlit_resolved.get(key)
+            if resolved is None:
+                font_family, font_path = _resolve_default_font(font_family, font_path)
+                patch_style_use()
+                install_tofu_audit()
+                resolved = _streamlit_resolved[key] = (font_family, font_path)
+                logger.debug(f"Streamlit 프로세스 초기화 완료: {key} -> {resolved}")
+    font_family, font_path = resolved
+
+    set_preferred(font_path, font_family, font_kwargs, session=session)
+    return font_family
+
 
 def matplotlib_font_reset(
     font_family: str | None = None, font_path: str | None = None, **kwargs: Any
@@ -52,6 +197,10 @@ def matplotlib_font_reset(
     1. font_path가 있으면 파일에서 폰트 패밀리 이름 추출
     2. font_family만 있으면 해당 이름 사용
     3. 둘 다 없으면 'NanumGothic' 기본값 사용
+
+    Streamlit 서버가 실행 중이면 (스크립트 실행 스레드가 아닌 스레드에서 호출해도) 다른 세션이
+    같은 matplotlib 모듈을 사용하므로 모듈을 재로드하지 않고 matplotlib_font_set() 과 같이
+    폰트 설정만 적용합니다.
     """
     if (
         isinstance(font_family, (str, bytes, os.PathLike))
@@ -64,39 +213,39 @@ def matplotlib_font_reset(
     default_kwargs: dict = {"axes.unicode_minus": False, "font.size": 10}
     default_kwargs.update(kwargs)
 
-    modules_to_remove = [mod for mod in sys.modules if mod.startswith("matplotlib")]
-    for mod in modules_to_remove:
-        del sys.modules[mod]
+    if is_streamlit_server_running():
+        # 실행 중인 서버의 다른 세션/스레드가 같은 matplotlib 모듈을 쓰고 있으므로 재로드하지 않음.
+        # 세션별 선호 폰트 저장은 스크립트 실행 스레드에서만 수행됨
+        logger.debug("Streamlit 서버 실행 중: matplotlib 재로드 없이 폰트만 재설정")
+        _streamlit_font_set(font_family, font_path, default_kwargs)
+        import matplotlib.pyplot as plt
 
-    import matplotlib.font_manager as fm
-    import matplotlib.pyplot as plt
+        return plt
+
+    _purge_matplotlib_modules()
+
+    with _weak_fork_hooks():
+        import matplotlib.font_manager as fm
+        import matplotlib.pyplot as plt
 
     try:
         fm._get_fontconfig_fonts.cache_clear()
     except Exception:
         pass
-    try:
-        fm.fontManager.__init__()
-    except Exception:
-        pass
+    if not is_slim_font_manager_enabled():
+        try:
+            fm.fontManager.__init__()
+        except Exception:
+            pass
 
     # 재로드 후 레지스트리 폰트 재등록
     matplotlib_font_resource.load_all()
 
-    if font_path is None and font_family is None:
-        font_family = "NanumGothic"
-        font_path = matplotlib_font_resource.path_of("NanumGothic")
-        if font_path is None or (font_path and not Path(font_path).exists()):
-            font_path = None
-            if sys.platform.startswith("win"):
-                font_family = "Malgun Gothic"
-            logger.debug(f"레지스트리 폰트 없음, 시스템 폰트 사용: {font_family}")
-        else:
-            logger.debug(f"레지스트리 폰트 경로: {font_path}")
+    font_family, font_path = _resolve_default_font(font_family, font_path)
 
     if font_path:
         try:
-            fm.fontManager.addfont(font_path)
+            addfont_once(font_path)
             fp = fm.FontProperties(fname=font_path)
             font_name = fp.get_name()
             plt.rcParams["font.family"] = font_name
@@ -131,6 +280,10 @@ def matplotlib_font_reset(
         font_path, font_family if font_family else plt.rcParams.get("font.family"), default_kwargs
     )
     patch_style_use()
+    install_tofu_audit()
+    install_glyph_cache()
+    install_textpath_cache()
+    apply_slim_font_manager()
 
     return plt
 
@@ -153,23 +306,27 @@ def matplotlib_font_set(
     -------
     str | None
         적용된 폰트 패밀리 이름
+
+    Notes
+    -----
+    Streamlit 스크립트 실행 중에는 기본 폰트 탐색과 패치를 프로세스당 한 번만 수행하고
+    (재실행마다 반복하지 않음), 선호 폰트는 세션별 session_state 에 저장됩니다.
+    rcParams 자체는 프로세스 전역이므로 세션마다 다른 폰트를 쓰는 경우 매 재실행마다
+    이 함수를 호출하여 현재 세션의 폰트를 다시 적용하세요.
     """
     default_kwargs: dict = {"axes.unicode_minus": False, "font.size": 10}
     default_kwargs.update(kwargs)
 
-    if font_path is None and font_family is None:
-        font_family = "NanumGothic"
-        font_path = matplotlib_font_resource.path_of("NanumGothic")
-        if font_path is None or (font_path and not Path(font_path).exists()):
-            font_path = None
-            if sys.platform.startswith("win"):
-                font_family = "Malgun Gothic"
-            logger.debug(f"레지스트리 폰트 없음, 시스템 폰트 사용: {font_family}")
-        else:
-            logger.debug(f"레지스트리 폰트 경로: {font_path}")
+    if is_streamlit_environment():
+        return _streamlit_font_set(font_family, font_path, default_kwargs)
+
+    font_family, font_path = _resolve_default_font(font_family, font_path)
 
     set_preferred(font_path, font_family, default_kwargs)
     patch_style_use()
+    install_tofu_audit()
+    # 경량 모드이면 새 선호 패밀리를 유지하도록 목록 재구성 (비활성화 상태면 무시)
+    apply_slim_font_manager()
 
     return font_family
 
@@ -204,24 +361,139 @@ def matplotlib_font_get() -> dict[str, str | None]:
     """
     font_path, font_family, _ = get_preferred()
 
-    if font_path is None and font_family is None:
-        font_family = "NanumGothic"
-        font_path = matplotlib_font_resource.path_of("NanumGothic")
-        if font_path is None or (font_path and not Path(font_path).exists()):
-            font_path = None
-            if sys.platform.startswith("win"):
-                font_family = "Malgun Gothic"
-            logger.debug(f"레지스트리 폰트 없음, 시스템 폰트 사용: {font_family}")
+    font_family, font_path = _resolve_default_font(font_family, font_path)
 
     return {"font_family": font_family, "font_path": font_path}
 
 
+def render_to_buffer(
+    fig: Any,
+    fmt: str = "rgba",
+    out: IO[bytes] | None = None,
+    *,
+    dpi: float | None = None,
+    **savefig_kwargs: Any,
+) -> Any:
+    """풀링된 Agg 렌더러로 Figure 를 렌더링하여 버퍼로 반환 (웹 응답용).
+
+    같은 크기(픽셀 폭/높이, dpi)의 Agg 렌더러를 프로세스 전역 풀에서 재사용하므로 요청마다
+    픽셀 버퍼를 새로 할당하지 않습니다. 폰트 설정(rcParams, fontManager)은 건드리지 않아
+    이미 로드된 한글 폰트 구성을 그대로 사용합니다.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        렌더링할 Figure (pyplot 없이 만든 Figure 도 가능)
+    fmt : str
+        - 'rgba': 렌더러 픽셀 버퍼를 복사 없이 가리키는 (높이, 폭, 4) uint8 배열 반환 (기본값)
+        - 'png' 등: savefig 가 지원하는 포맷으로 인코딩하여 out 에 기록
+    out : IO[bytes] | None
+        fmt 가 'rgba' 가 아닐 때 인코딩 결과를 기록할 쓰기 가능한 바이너리 객체
+        (BytesIO, 응답 스트림 등). None 이면 bytes 로 반환
+    dpi : float | None
+        렌더링 dpi. None 이면 'rgba' 는 fig.dpi, 그 외는 rcParams['savefig.dpi']
+    **savefig_kwargs
+        fmt 가 'rgba' 가 아닐 때 Figure.savefig 에 전달할 추가 인자
+
+    Returns
+    -------
+    np.ndarray | bytes | IO[bytes]
+        'rgba' 이면 픽셀 배열, out 을 지정하면 out, 그 외에는 인코딩된 bytes
+
+    Notes
+    -----
+    'rgba' 배열은 렌더러 버퍼의 뷰이며, 배열(및 배열에서 만든 memoryview/슬라이스)이 모두
+    해제되면 렌더러가 풀로 돌아갑니다. 그 전까지 해당 렌더러는 다른 요청에 쓰이지 않으므로
+    응답 전송 후 참조를 유지하지 마세요. bbox_inches='tight' 처럼 저장 중 크기가 바뀌는 경우에도
+    각 크기별 렌더러를 풀에서 빌려 씁니다.
+
+    Examples
+    --------
+    >>> from io import BytesIO
+    >>> from matplotlib.figure import Figure
+    >>> fig = Figure(figsize=(4, 3), dpi=100)
+    >>> fig.subplots().set_title("매출 추이")
+    >>> render_to_buffer(fig).shape
+    (300, 400, 4)
+    >>> buf = BytesIO()
+    >>> render_to_buffer(fig, "png", buf)  # doctest: +ELLIPSIS
+    <_io.BytesIO object at ...>
+    """
+    import numpy as np
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    if fmt != "rgba" and out is None:
+        buffer = io.BytesIO()
+        render_to_buffer(fig, fmt, buffer, dpi=dpi, **savefig_kwargs)
+        return buffer.getvalue()
+
+    orig_canvas = fig.canvas
+    canvas = orig_canvas if isinstance(orig_canvas, FigureCanvasAgg) else FigureCanvasAgg(fig)
+    saved_renderer = canvas.__dict__.get("renderer")
+    saved_key = getattr(canvas, "_lastKey", None)
+    # {(width, height, dpi): RendererAgg} — 이번 렌더링 동안 풀에서 빌린 렌더러
+    held: dict = {}
+
+    def get_renderer(*args, **kwargs):
+        w, h = canvas.get_width_height(physical=True)
+        key = (w, h, fig.dpi)
+        if key not in held:
+            held[key] = acquire(key)
+        canvas._lastKey = key
+        # matplotlib < 3.6 의 get_renderer(cleared=True) 호환
+        if args[0] if args else kwargs.get("cleared", False):
+            held[key].clear()
+        return held[key]
+
+    canvas.get_renderer = get_renderer
+    try:
+        if fmt == "rgba":
+            orig_dpi = fig.dpi
+            if dpi is not None:
+                fig.dpi = dpi
+            try:
+                canvas.draw()
+            finally:
+                if dpi is not None:
+                    fig.dpi = orig_dpi
+            key = canvas._lastKey
+            renderer = held.pop(key)
+            result = np.asarray(renderer.buffer_rgba())
+            # 배열이 해제될 때 렌더러를 풀로 반환 (그 전까지 다른 요청이 버퍼를 덮어쓰지 않음)
+            weakref.finalize(result, release, key, renderer)
+        else:
+            if dpi is not None:
+                savefig_kwargs["dpi"] = dpi
+            fig.savefig(out, format=fmt, **savefig_kwargs)
+            result = out
+    finally:
+        del canvas.get_renderer
+        if saved_renderer is None:
+            canvas.__dict__.pop("renderer", None)
+        else:
+            canvas.renderer = saved_renderer
+        canvas._lastKey = saved_key
+        if getattr(fig, "_cachedRenderer", None) is not None:
+            fig._cachedRenderer = None
+        for key, renderer in held.items():
+            release(key, renderer)
+        if canvas is not orig_canvas:
+            fig.set_canvas(orig_canvas)
+    return result
+
+
 # 패키지 폰트 일괄 등록 (import 시점)
 matplotlib_font_resource.load_all()
 
 # 환경별 자동 초기화
 try:
-    if is_jupyter_environment():
+    if is_streamlit_environment():
+        # 첫 세션의 스크립트 스레드에서 임포트되더라도 프로세스 기본값으로 저장
+        _family = _streamlit_font_set(
+            None, None, {"axes.unicode_minus": False, "font.size": 10}, session=False
+        )
+        logger.info(f"Streamlit 환경 감지: 프로세스 1회 초기화 폰트: {_family}")
+    elif is_jupyter_environment():
         matplotlib_font_reset()
         logger.info("Jupyter/IPython 환경 감지: matplotlib_font_reset() 실행")
     else:
@@ -0,0 +1,114 @@
+"""matplotlib_font_reset() / matplotlib_font_set() 반복 시 자원 누수와 이전 모듈 참조 동작 검사."""
+
+import gc
+import logging
+import os
+import sys
+import warnings
+
+import matplotlib
+import pytest
+
+matplotlib.use("Agg")
+
+import matplotlib as mpl  # noqa: E402
+import matplotlib.ticker as mticker  # noqa: E402
+
+from helper_plot_hangul import (  # noqa: E402
+    matplotlib_font_reset,
+    matplotlib_font_resource,
+    matplotlib_font_set,
+)
+
+# 기본 실행은 짧게, 1,000회 반복은 slow 검사 (HELPER_PLOT_HANGUL_SLOW_TESTS=1) 로 실행
+ITERATIONS = int(os.environ.get("HELPER_PLOT_HANGUL_LIFECYCLE_ITERATIONS", "20"))
+SLOW_ITERATIONS = 1000
+WARMUP = 5
+
+# 워밍업 이후 허용 증가량
+MAX_RSS_GROWTH_MB = 64
+MAX_OBJECTS_GROWTH = 20_000
+
+
+def _rss_mb() -> float | None:
+    """현재 프로세스 RSS (MB). 측정할 수 없으면 None."""
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / 2**20
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _snapshot() -> tuple:
+    gc.collect()
+    fm = sys.modules["matplotlib.font_manager"]
+    return (
+        _rss_mb(),
+        len(gc.get_objects()),
+        len(fm.fontManager.ttflist),
+        len(matplotlib_font_resource._contexts),
+    )
+
+
+def _cycle() -> None:
+    plt = matplotlib_font_reset()
+    matplotlib_font_set()
+    fig, ax = plt.subplots()
+    ax.set_title("한글 제목")
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def _cycles(n: int) -> None:
+    # pytest 의 로그/경고 수집 목록이 커지지 않도록 반복 중에는 출력을 끔
+    logging.disable(logging.CRITICAL)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for _ in range(n):
+                _cycle()
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def _check_bounded(iterations: int) -> None:
+    _cycles(WARMUP)
+    rss0, objects0, ttf0, contexts0 = _snapshot()
+
+    _cycles(iterations)
+    rss1, objects1, ttf1, contexts1 = _snapshot()
+
+    assert ttf1 == ttf0
+    assert contexts1 == contexts0
+    assert contexts1 <= len(matplotlib_font_resource.families())
+    assert objects1 - objects0 < MAX_OBJECTS_GROWTH
+    if rss0 is not None and rss1 is not None:
+        assert rss1 - rss0 < MAX_RSS_GROWTH_MB
+
+
+def test_reset_set_cycle_is_bounded():
+    _check_bounded(ITERATIONS)
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    not os.environ.get("HELPER_PLOT_HANGUL_SLOW_TESTS"),
+    reason="HELPER_PLOT_HANGUL_SLOW_TESTS=1 일 때만 실행 (matplotlib 1,000회 재로드)",
+)
+def test_reset_set_cycle_is_bounded_long():
+    _check_bounded(SLOW_ITERATIONS)
+
+
+def test_pre_reset_module_references_still_work():
+    matplotlib_font_reset()
+    matplotlib_font_set()
+
+    assert mpl.rcParams["font.size"] > 0
+    locator = mticker.MaxNLocator(3)
+    assert len(locator.tick_values(0, 10)) > 0
@@ -0,0 +1,71 @@
+"""폰트 레지스트리 동시 접근 검사."""
+
+import threading
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import pytest  # noqa: E402
+
+import helper_plot_hangul.helper_plot_hangul as hph  # noqa: E402
+from helper_plot_hangul import matplotlib_font_get, matplotlib_font_resource  # noqa: E402
+
+FAMILY = "NanumBarunGothic"
+# matplotlib_font_get() 기본 폰트 해석이 레지스트리를 거치도록 임시 등록하는 패밀리
+DEFAULT_FAMILY = "NanumGothic"
+THREADS = 4
+ROUNDS = 200
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    filename = matplotlib_font_resource._registry[FAMILY]
+    path = matplotlib_font_resource.path_of(FAMILY)
+    assert path is not None
+    monkeypatch.setattr(hph, "get_preferred", lambda: (None, None, {}))
+    matplotlib_font_resource.register(DEFAULT_FAMILY, path)
+    yield filename, path
+    matplotlib_font_resource.unregister(DEFAULT_FAMILY)
+    matplotlib_font_resource.register(FAMILY, filename)
+
+
+def test_concurrent_register_and_lookup(registry):
+    filename, path = registry
+    stop = threading.Event()
+    errors = []
+
+    def writer():
+        try:
+            for i in range(ROUNDS):
+                # 재등록은 해석된 경로 캐시를 비우므로 읽는 쪽이 경로를 다시 해석하게 됨
+                matplotlib_font_resource.register(FAMILY, filename)
+                matplotlib_font_resource.register(DEFAULT_FAMILY, path)
+                if i % 20 == 0:
+                    matplotlib_font_resource.load_all()
+        except Exception as e:
+            errors.append(e)
+
+    def reader():
+        try:
+            while not stop.is_set():
+                assert matplotlib_font_resource.path_of(FAMILY) == path
+                assert matplotlib_font_resource.path_of(DEFAULT_FAMILY) == path
+                info = matplotlib_font_get()
+                assert info["font_family"] == DEFAULT_FAMILY
+                assert info["font_path"] == path
+        except Exception as e:
+            errors.append(e)
+
+    readers = [threading.Thread(target=reader) for _ in range(THREADS)]
+    writers = [threading.Thread(target=writer) for _ in range(2)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    assert errors == []
+    assert {FAMILY, DEFAULT_FAMILY} <= set(matplotlib_font_resource.families())
@@ -0,0 +1,105 @@
+"""등록된 폰트 폴더 변경 감시(poll_font_dirs) 검사."""
+
+import os
+import shutil
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+
+from helper_plot_hangul import (  # noqa: E402
+    _glyph_cache,
+    matplotlib_font_resource,
+    poll_font_dirs,
+)
+
+SOURCE_FAMILY = "NanumBarunGothic"
+
+
+def _ttflist() -> list:
+    # 다른 테스트의 matplotlib_font_reset() 이후에도 현재 로드된 fontManager 를 사용
+    import matplotlib.font_manager as fm
+
+    return [entry.fname for entry in fm.fontManager.ttflist]
+
+
+def _ttflist_paths() -> set:
+    return set(_ttflist())
+
+
+def _cache_key(*paths: str) -> tuple:
+    # (폴백 포함 폰트 경로 tuple, 문자열, 크기, dpi, 힌팅, 안티앨리어싱)
+    return (tuple(paths), "가", 10.0, 72.0, 0, True)
+
+
+def _put_cache_entry(key: tuple) -> None:
+    _glyph_cache._cache.put(key, (np.zeros((2, 2), dtype=np.uint8), 0.0, 0.0, 0.0))
+
+
+def _cached(key: tuple) -> bool:
+    return _glyph_cache._cache.get(key) is not None
+
+
+@pytest.fixture
+def fonts_dir(tmp_path):
+    source = matplotlib_font_resource.path_of(SOURCE_FAMILY)
+    shutil.copy(source, tmp_path / "WatchA.ttf")
+    directory = str(tmp_path.resolve())
+    assert matplotlib_font_resource.register_fonts_dir(directory) == ["WatchA"]
+    yield tmp_path, source
+    for ttf in tmp_path.glob("*.ttf"):
+        ttf.unlink()
+    poll_font_dirs()
+    with matplotlib_font_resource._lock:
+        matplotlib_font_resource._font_dirs.pop(directory, None)
+    _glyph_cache.clear_glyph_cache()
+
+
+def test_poll_add_change_delete(fonts_dir):
+    tmp_path, source = fonts_dir
+    path_a = str((tmp_path / "WatchA.ttf").resolve())
+    path_b = str((tmp_path / "WatchB.ttf").resolve())
+    matplotlib_font_resource.load_all()
+    assert path_a in _ttflist_paths()
+
+    # 변경 없음
+    assert poll_font_dirs() == {"added": [], "changed": [], "removed": [], "paths": []}
+
+    # 추가
+    shutil.copy(source, path_b)
+    delta = poll_font_dirs()
+    assert delta == {"added": ["WatchB"], "changed": [], "removed": [], "paths": []}
+    assert matplotlib_font_resource.path_of("WatchB") == path_b
+    assert path_b in _ttflist_paths()
+
+    # 수정 시각 변경: 변경된 파일을 참조하는 래스터 캐시 항목만 제거
+    key_a = _cache_key(path_a)
+    key_fallback_a = _cache_key(source, path_a)
+    key_b = _cache_key(path_b)
+    key_other = _cache_key(source)
+    for key in (key_a, key_fallback_a, key_b, key_other):
+        _put_cache_entry(key)
+    stat = os.stat(path_a)
+    os.utime(path_a, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    delta = poll_font_dirs()
+    assert delta == {"added": [], "changed": ["WatchA"], "removed": [], "paths": [path_a]}
+    assert _ttflist().count(path_a) == 1
+    assert not _cached(key_a)
+    assert not _cached(key_fallback_a)
+    assert _cached(key_b)
+    assert _cached(key_other)
+
+    # 삭제
+    Path(path_b).unlink()
+    delta = poll_font_dirs()
+    assert delta == {"added": [], "changed": [], "removed": ["WatchB"], "paths": [path_b]}
+    assert "WatchB" not in matplotlib_font_resource.families()
+    assert path_b not in _ttflist_paths()
+    assert path_a in _ttflist_paths()
+    assert not _cached(key_b)
+    assert _cached(key_other)
@@ -0,0 +1,49 @@
+"""Agg 한글 텍스트 래스터 캐시 검사."""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+
+from helper_plot_hangul import (  # noqa: E402
+    disable_glyph_cache,
+    enable_glyph_cache,
+    glyph_cache_info,
+    matplotlib_font_reset,
+    matplotlib_font_resource,
+)
+
+
+@pytest.fixture
+def plt():
+    font_path = matplotlib_font_resource.path_of(matplotlib_font_resource.families()[0])
+    yield matplotlib_font_reset(font_path=font_path)
+    disable_glyph_cache()
+
+
+def _render(plt, fontsize: float, dpi: float) -> np.ndarray:
+    fig = plt.figure(figsize=(3, 1), dpi=dpi)
+    fig.text(0.1, 0.4, "한글 제목 테스트", fontsize=fontsize)
+    fig.text(0.33, 0.7, "가나다 abc 123", fontsize=fontsize * 0.7)
+    fig.canvas.draw()
+    pixels = np.asarray(fig.canvas.buffer_rgba()).copy()
+    plt.close(fig)
+    return pixels
+
+
+@pytest.mark.parametrize("fontsize, dpi", [(14, 100), (10, 72), (11.3, 150)])
+def test_cached_text_matches_uncached_pixels(plt, fontsize, dpi):
+    disable_glyph_cache()
+    expected = _render(plt, fontsize, dpi)
+
+    enable_glyph_cache()
+    first = _render(plt, fontsize, dpi)
+    hits = glyph_cache_info()["hits"]
+    second = _render(plt, fontsize, dpi)
+
+    np.testing.assert_array_equal(first, expected)
+    np.testing.assert_array_equal(second, expected)
+    # 두 번째 그리기는 두 텍스트 모두 캐시 적중
+    assert glyph_cache_info()["hits"] == hits + 2
@@ -0,0 +1,86 @@
+"""웹 서빙용 Agg 렌더러 풀 검사."""
+
+import gc
+import io
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+
+from helper_plot_hangul import (  # noqa: E402
+    clear_render_pool,
+    matplotlib_font_reset,
+    matplotlib_font_resource,
+    render_pool_info,
+    render_to_buffer,
+)
+
+# 패키지 레지스트리에 포함된 한글 폰트
+FAMILY = "NanumBarunGothic"
+
+
+@pytest.fixture
+def plt():
+    plt = matplotlib_font_reset(font_family=FAMILY)
+    clear_render_pool()
+    yield plt
+    plt.close("all")
+    clear_render_pool()
+
+
+def _figure(plt):
+    fig, ax = plt.subplots(figsize=(3, 2), dpi=80)
+    ax.plot([0, 1, 2], [1, 0, 2])
+    ax.set_title("한글 제목")
+    ax.set_xlabel("가로축")
+    return fig
+
+
+def test_fixture_font_is_registered():
+    assert FAMILY in matplotlib_font_resource.families()
+
+
+def test_rgba_matches_canvas_draw(plt):
+    fig = _figure(plt)
+    rgba = render_to_buffer(fig, "rgba")
+    fig.canvas.draw()
+    expected = np.asarray(fig.canvas.buffer_rgba())
+    assert rgba.shape == expected.shape
+    assert np.array_equal(rgba, expected)
+
+
+def test_png_matches_savefig(plt):
+    fig = _figure(plt)
+    data = render_to_buffer(fig, "png")
+    expected = io.BytesIO()
+    fig.savefig(expected, format="png")
+    assert data == expected.getvalue()
+
+
+def test_renderer_is_reused_after_release(plt):
+    fig = _figure(plt)
+    rgba = render_to_buffer(fig, "rgba")
+    # 배열이 살아 있는 동안에는 렌더러를 풀에 반환하지 않음
+    assert render_pool_info()["renderers"] == 0
+    assert render_pool_info()["misses"] == 1
+    del rgba
+    gc.collect()
+    assert render_pool_info()["renderers"] == 1
+
+    render_to_buffer(fig, "png")
+    info = render_pool_info()
+    assert info["hits"] == 1
+    assert info["misses"] == 1
+    assert info["renderers"] == 1
+
+
+def test_renderer_from_purged_modules_is_not_pooled(plt):
+    rgba = render_to_buffer(_figure(plt), "rgba")
+    plt = matplotlib_font_reset(font_family=FAMILY)
+    del rgba
+    gc.collect()
+    assert render_pool_info()["renderers"] == 0
+    plt.close("all")
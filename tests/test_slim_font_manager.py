@@ -0,0 +1,88 @@
+"""경량 FontManager 모드 검사."""
+
+import dataclasses
+import os
+import shutil
+from types import SimpleNamespace
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from helper_plot_hangul import (  # noqa: E402
+    disable_slim_font_manager,
+    enable_slim_font_manager,
+    matplotlib_font_reset,
+    matplotlib_font_resource,
+    matplotlib_font_set,
+    poll_font_dirs,
+    slim_font_family_map,
+)
+
+
+def test_font_dir_change_with_list_preferred_family(tmp_path):
+    font_path = matplotlib_font_resource.path_of(matplotlib_font_resource.families()[0])
+    added = tmp_path / "SlimTestFont.ttf"
+    matplotlib_font_resource.register_fonts_dir(tmp_path)
+    enable_slim_font_manager()
+    try:
+        # 선호 패밀리가 rcParams['font.family'] 목록으로 저장되는 경로
+        plt = matplotlib_font_reset(font_path=font_path)
+        shutil.copy(font_path, added)
+        # 변경분이 있어야 poll_font_dirs() 가 경량 목록을 재구성함
+        assert poll_font_dirs()["added"] == ["SlimTestFont"]
+        assert plt.rcParams["font.family"][0] in slim_font_family_map()
+    finally:
+        if added.exists():
+            added.unlink()
+        poll_font_dirs()
+        disable_slim_font_manager()
+
+
+def test_font_set_keeps_system_family_filtered_out_earlier(monkeypatch):
+    import matplotlib.font_manager as fm
+
+    font_path = matplotlib_font_resource.path_of(matplotlib_font_resource.families()[0])
+    # 경량 목록에 없는 시스템 폰트 역할 (matplotlib 폰트 캐시의 전체 목록에만 존재)
+    family = "Slim Test System Font"
+    entry = dataclasses.replace(fm.ttfFontProperty(fm.get_font(font_path)), name=family)
+    enable_slim_font_manager()
+    try:
+        assert family not in slim_font_family_map()
+        with monkeypatch.context() as m:
+            m.setattr(
+                fm,
+                "_load_fontmanager",
+                lambda try_read_cache=True: SimpleNamespace(ttflist=[entry], afmlist=[]),
+            )
+            matplotlib_font_set(font_family=family)
+
+        assert family in slim_font_family_map()
+        found = fm.findfont(fm.FontProperties(family=family), fallback_to_default=False)
+        assert os.path.samefile(found, font_path)
+    finally:
+        disable_slim_font_manager()
+        matplotlib_font_set()
+
+
+def test_family_map_lookup_matches_full_scan():
+    import matplotlib.font_manager as fm
+
+    from helper_plot_hangul import _slim_font_manager
+
+    family = matplotlib_font_resource.families()[0]
+    enable_slim_font_manager(fallback_families=("DejaVu Serif",))
+    try:
+        for name in (family, family.lower(), "DejaVu Sans", "DejaVu Serif", "sans-serif"):
+            for style in ("normal", "italic"):
+                prop = fm.FontProperties(family=name, style=style)
+                fm.fontManager._findfont_cached.cache_clear()
+                fast = fm.findfont(prop)
+                _slim_font_manager._enabled = False
+                try:
+                    fm.fontManager._findfont_cached.cache_clear()
+                    assert fm.findfont(prop) == fast
+                finally:
+                    _slim_font_manager._enabled = True
+    finally:
+        disable_slim_font_manager()
@@ -0,0 +1,46 @@
+"""Streamlit 서버 실행 중 동작 검사 (streamlit 런타임을 흉내 낸 모듈 사용)."""
+
+import sys
+from types import ModuleType
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from helper_plot_hangul import matplotlib_font_reset  # noqa: E402
+from helper_plot_hangul._env import (  # noqa: E402
+    is_streamlit_environment,
+    is_streamlit_server_running,
+)
+
+
+def _fake_streamlit(monkeypatch, running: bool) -> None:
+    streamlit = ModuleType("streamlit")
+    runtime = ModuleType("streamlit.runtime")
+    runtime.exists = lambda: running
+    streamlit.runtime = runtime
+    monkeypatch.setitem(sys.modules, "streamlit", streamlit)
+    monkeypatch.setitem(sys.modules, "streamlit.runtime", runtime)
+
+
+def test_reset_off_script_thread_does_not_purge_running_server(monkeypatch):
+    matplotlib_font_reset()
+    before = sys.modules["matplotlib"]
+    _fake_streamlit(monkeypatch, running=True)
+
+    # 스크립트 실행 컨텍스트는 없지만 서버는 실행 중
+    assert not is_streamlit_environment()
+    assert is_streamlit_server_running()
+    plt = matplotlib_font_reset()
+
+    assert sys.modules["matplotlib"] is before
+    assert plt is sys.modules["matplotlib.pyplot"]
+
+
+def test_reset_without_running_server_reloads(monkeypatch):
+    matplotlib_font_reset()
+    before = sys.modules["matplotlib"]
+    _fake_streamlit(monkeypatch, running=False)
+
+    matplotlib_font_reset()
+    assert sys.modules["matplotlib"] is not before
@@ -0,0 +1,57 @@
+"""대량 한글 라벨용 일괄 텍스트 아티스트 검사."""
+
+import datetime
+import gc
+import weakref
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+
+from helper_plot_hangul import (  # noqa: E402
+    hangul_text_collection,
+    matplotlib_font_reset,
+    matplotlib_font_resource,
+)
+
+
+@pytest.fixture
+def plt():
+    return matplotlib_font_reset()
+
+
+def test_default_font_covers_hangul(plt):
+    fig, ax = plt.subplots()
+    artist = hangul_text_collection(ax, [0, 1], [0, 1], ["서울", "부산"])
+    registered = {matplotlib_font_resource.path_of(f) for f in matplotlib_font_resource.families()}
+    assert artist._glyphs.path in registered
+    plt.close(fig)
+
+
+def test_categorical_and_date_axes(plt):
+    fig, ax = plt.subplots()
+    artist = hangul_text_collection(ax, ["가", "나", "다"], [1, 2, 3], ["서울", "부산", "대구"])
+    np.testing.assert_array_equal(artist._offsets[:, 0], [0, 1, 2])
+
+    dates = [datetime.date(2024, 1, day) for day in (1, 2, 3)]
+    fig2, ax2 = plt.subplots()
+    artist = hangul_text_collection(ax2, dates, [1, 2, 3], ["서울", "부산", "대구"])
+    np.testing.assert_allclose(np.diff(artist._offsets[:, 0]), [1, 1])
+    fig2.canvas.draw()
+    plt.close(fig)
+    plt.close(fig2)
+
+
+def test_reset_releases_artist_class(plt):
+    fig, ax = plt.subplots()
+    artist = hangul_text_collection(ax, [0], [0], ["서울"])
+    old_cls = weakref.ref(type(artist))
+    plt.close(fig)
+    del fig, ax, artist
+
+    matplotlib_font_reset()
+    gc.collect()
+    assert old_cls() is None
@@ -0,0 +1,53 @@
+"""렌더러 없는 문자열 폭 측정/줄바꿈/말줄임 검사."""
+
+import numpy as np
+import pytest
+
+from helper_plot_hangul import (
+    matplotlib_font_resource,
+    measure_text_width,
+    truncate_texts,
+    wrap_texts,
+)
+from helper_plot_hangul._font_utils import preferred_font_file
+
+
+@pytest.fixture
+def font_path():
+    return matplotlib_font_resource.path_of("NanumBarunGothic")
+
+
+def test_measure_text_width(font_path):
+    widths = measure_text_width(
+        ["서울특별시", "부산광역시 해운대구", "", "가\n가나다"],
+        fontsize=10,
+        dpi=100,
+        font_path=font_path,
+    )
+    np.testing.assert_allclose(widths[:2], [61.94438785, 114.61100624])
+    assert widths[2] == 0
+    # 여러 줄 문자열은 가장 긴 줄의 폭
+    assert widths[3] == pytest.approx(measure_text_width(["가나다"], 10, 100, font_path)[0])
+
+
+def test_truncate_texts(font_path):
+    result = truncate_texts(
+        ["서울특별시 강남구 역삼동", "부산"], max_width=80, fontsize=10, font_path=font_path
+    )
+    assert result == ["서울특별시 강남…", "부산"]
+    assert measure_text_width(result[:1], fontsize=10, font_path=font_path)[0] <= 80
+
+
+def test_wrap_texts(font_path):
+    result = wrap_texts(
+        ["서울특별시 강남구 역삼동"], max_width=60, fontsize=10, font_path=font_path
+    )
+    assert result == ["서울특별시\n강남구 역삼동"]
+
+
+def test_preferred_font_file_falls_back_to_registered_hangul_font(monkeypatch, font_path):
+    from helper_plot_hangul import _font_utils
+
+    # 선호 패밀리가 레지스트리/시스템에 없으면 matplotlib 기본 폰트 대신 레지스트리 한글 폰트
+    monkeypatch.setattr(_font_utils, "get_preferred", lambda: (None, "NoSuchHangulFont", {}))
+    assert preferred_font_file() == font_path